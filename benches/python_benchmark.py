@@ -7,17 +7,35 @@ Measures latency, throughput, CPU, and memory usage.
 """
 
 import os
+import sys
 import asyncio
+import multiprocessing
 import time
-import json
-import httpx
+import aiohttp
+import orjson
 from hdrh.histogram import HdrHistogram
 
+# Hot loop lives in its own module so it can be compiled with mypyc
+from _bench_hot import worker
+
+# uvloop is on by default for a fair comparison; USE_UVLOOP=0 measures stock asyncio
+if os.getenv("USE_UVLOOP", "1") == "1":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
 BASE = os.getenv("BASE", "http://localhost:3000")
 ROUTE = os.environ.get("ROUTE", "/v1/chat/completions")
 C = int(os.getenv("C", "32"))
 T = int(os.getenv("T", "60"))
 SIZE = os.getenv("SIZE", "S")
+# Number of client processes; C is split across them to get past the GIL
+WORKERS = int(os.getenv("WORKERS", "1"))
+for arg in sys.argv[1:]:
+    if arg.startswith("--workers="):
+        WORKERS = int(arg.split("=", 1)[1])
 
 def get_content(size: str) -> str:
     """Create payload based on size"""
@@ -33,53 +51,61 @@ def get_content(size: str) -> str:
 
 content = get_content(SIZE)
 
+# Serialize the request body once at startup; every request sends the same
+# bytes object, so even the 256KB "L" body is never re-encoded or copied
+PAYLOAD = orjson.dumps({
+    "model": "test-model",
+    "messages": [{"role": "user", "content": content}],
+})
+HEADERS = {"content-type": "application/json"}
+URL = f"{BASE}{ROUTE}"
+
 # Initialize histogram for nanosecond precision
 hist = HdrHistogram(1, 60_000_000_000, 3)  # ns
-end = time.time() + T
 
-print(f"Starting Python benchmark: route={ROUTE}, concurrency={C}, duration={T}s, payload={SIZE}")
+async def run_workers(concurrency: int, deadline: float):
+    """Run `concurrency` closed-loop workers in this process"""
+    # One session shared by all workers: a single keep-alive pool sized to the
+    # concurrency. aiohttp has far lower per-request Python overhead than
+    # httpx, so the benchmark measures the server rather than the client
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300, keepalive_timeout=75)
+    timeout = aiohttp.ClientTimeout(total=30.0)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(*[
+            worker(session, URL, PAYLOAD, HEADERS, deadline, hist) for _ in range(concurrency)
+        ])
 
-async def worker():
-    """Worker coroutine that sends requests in a closed loop"""
-    ok = err = timeouts = 0
-    
-    timeout = httpx.Timeout(30.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        while time.time() < end:
-            t0 = time.perf_counter_ns()
-            try:
-                r = await client.post(
-                    f"{BASE}{ROUTE}", 
-                    json={
-                        "model": "test-model",
-                        "messages": [{"role": "user", "content": content}]
-                    }
-                )
-                # Consume response body
-                _ = r.content
-                dt = time.perf_counter_ns() - t0
-                hist.record_value(dt)
-                
-                if 200 <= r.status_code < 300:
-                    ok += 1
-                else:
-                    err += 1
-                    
-            except asyncio.TimeoutError:
-                dt = time.perf_counter_ns() - t0
-                hist.record_value(dt)
-                timeouts += 1
-            except Exception:
-                dt = time.perf_counter_ns() - t0
-                hist.record_value(dt)
-                err += 1
-                
-    return ok, err, timeouts
-
-async def main():
+def run_process(args):
+    """Subprocess entry point: run a share of the workers, return counters and histogram"""
+    index, concurrency, deadline = args
+
+    # Pin each process to its own CPU where the platform allows it
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+    done = asyncio.run(run_workers(concurrency, deadline))
+    return done, hist.encode()
+
+def main():
     """Main benchmark function"""
+    print(f"Starting Python benchmark: route={ROUTE}, concurrency={C}, duration={T}s, payload={SIZE}, workers={WORKERS}")
     oks = errs = timeouts = 0
-    done = await asyncio.gather(*[worker() for _ in range(C)])
+    # Monotonic clock: immune to wall-clock (NTP) adjustments during the run
+    deadline = time.monotonic() + T
+
+    if WORKERS > 1:
+        shares = [C // WORKERS + (1 if i < C % WORKERS else 0) for i in range(WORKERS)]
+        jobs = [(i, share, deadline) for i, share in enumerate(shares) if share]
+        # Each process ships its histogram in the compressed HdrHistogram V2
+        # wire format; merge them as they arrive instead of holding them all
+        done = []
+        with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+            for part_done, blob in pool.imap_unordered(run_process, jobs):
+                done.extend(part_done)
+                hist.decode_and_add(blob)
+    else:
+        done = asyncio.run(run_workers(C, deadline))
     
     for o, e, t in done:
         oks += o
@@ -87,6 +113,9 @@ async def main():
         timeouts += t
     
     total_reqs = oks + errs + timeouts
+
+    # One sweep over the counts array for all percentiles
+    pct = hist.get_percentile_to_value_dict([50, 95, 99])
     
     out = {
         "lang": "python",
@@ -96,9 +125,9 @@ async def main():
         "reqs": total_reqs,
         "throughput_rps": total_reqs / T,
         "latency_ms": {
-            "p50": hist.get_value_at_percentile(50) / 1e6,
-            "p95": hist.get_value_at_percentile(95) / 1e6,
-            "p99": hist.get_value_at_percentile(99) / 1e6,
+            "p50": pct.get(50, 0) / 1e6,
+            "p95": pct.get(95, 0) / 1e6,
+            "p99": pct.get(99, 0) / 1e6,
         },
         "errors": {
             "non2xx": errs,
@@ -108,10 +137,10 @@ async def main():
         "success_rate": (oks / total_reqs) * 100.0
     }
     
-    print(json.dumps(out))
+    print(orjson.dumps(out).decode())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
 
 
 
@@ -17,7 +17,6 @@ import asyncio
 import time
 import logging
 from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -102,26 +101,19 @@ class AsyncLLMProcessor:
         max_tokens: int = 100,
         max_concurrent: int = 10
     ) -> List[Dict[str, Any]]:
-        """Process multiple requests concurrently with asyncio."""
+        """Process multiple requests concurrently on the Rust runtime."""
         
         logger.info(f"🔄 Processing {len(prompts)} requests concurrently...")
         start_time = time.time()
         
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def process_single(prompt: str) -> Dict[str, Any]:
-            async with semaphore:
-                messages = [nexus_nitro_llm.create_message("user", prompt)]
-                return await self.async_client.chat_completions_async(
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=0.7
-                )
-        
-        # Process all requests concurrently
-        tasks = [process_single(prompt) for prompt in prompts]
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        # One await for the whole batch; concurrency is bounded inside Rust
+        messages_list = [[nexus_nitro_llm.create_message("user", prompt)] for prompt in prompts]
+        responses = await self.async_client.chat_completions_many(
+            messages_list,
+            max_tokens=max_tokens,
+            temperature=0.7,
+            max_concurrent=max_concurrent
+        )
         
         elapsed = (time.time() - start_time) * 1000
         successful_responses = [r for r in responses if not isinstance(r, Exception)]
@@ -161,7 +153,10 @@ class AsyncLLMProcessor:
         logger.info("\n💬 Async multi-turn conversation demo")
         logger.info("-" * 50)
         
-        conversation_history = []
+        # Messages are created once and reused on every later turn
+        conversation_messages = [
+            nexus_nitro_llm.create_message("system", "You are a knowledgeable AI assistant.")
+        ]
         
         turns = [
             "What is machine learning?",
@@ -175,36 +170,25 @@ class AsyncLLMProcessor:
         for i, user_input in enumerate(turns, 1):
             logger.info(f"\n👤 User: {user_input}")
             
-            # Build conversation history efficiently
-            messages = [nexus_nitro_llm.create_message("system", "You are a knowledgeable AI assistant.")]
-            
-            # Add conversation history
-            for role, content in conversation_history:
-                messages.append(nexus_nitro_llm.create_message(role, content))
-            
             # Add current user message
-            messages.append(nexus_nitro_llm.create_message("user", user_input))
+            conversation_messages.append(nexus_nitro_llm.create_message("user", user_input))
             
-            # Send async request
+            # Send async request; only the reply text crosses back into Python
             start_time = time.time()
-            response = await self.async_client.chat_completions_async(
-                messages=messages,
+            assistant_response = await self.async_client.chat_completion_content_only(
+                messages=conversation_messages,
                 max_tokens=150,
                 temperature=0.7
             )
             request_time = (time.time() - start_time) * 1000
             total_time += request_time
             
-            # Extract assistant response
-            if isinstance(response, dict) and 'choices' in response:
-                assistant_response = response['choices'][0]['message']['content']
-                logger.info(f"🤖 Assistant: {assistant_response}")
-                
-                # Add to history for next turn
-                conversation_history.append(("user", user_input))
-                conversation_history.append(("assistant", assistant_response))
-            else:
-                logger.info(f"🤖 Assistant: [Response format: {type(response)}]")
+            logger.info(f"🤖 Assistant: {assistant_response}")
+            
+            # Add to history for next turn
+            conversation_messages.append(
+                nexus_nitro_llm.create_message("assistant", assistant_response)
+            )
             
             logger.info(f"   ⚡ Async response time: {request_time:.1f}ms")
         
@@ -109,18 +109,24 @@ def main():
     print("  • Zero-copy data transfer where possible")
     print("  • Memory-safe operations with Rust guarantees")
 
-def benchmark_comparison():
+    return client
+
+def benchmark_comparison(base_client=None):
     """Compare performance between Python bindings and HTTP requests."""
 
     print("\n🏁 Performance Benchmark Comparison")
     print("=" * 40)
 
     # Create client for direct calls
-    config = nexus_nitro_llm.PyConfig(
-        lightllm_url="http://localhost:8000",
-        model_id="llama"
-    )
-    client = nexus_nitro_llm.PyLightLLMClient(config)
+    if base_client is not None:
+        # Reuse the existing client's runtime and connection pool
+        client = base_client.clone_with(model_id="llama")
+    else:
+        config = nexus_nitro_llm.PyConfig(
+            lightllm_url="http://localhost:8000",
+            model_id="llama"
+        )
+        client = nexus_nitro_llm.PyLightLLMClient(config)
 
     # Test message
     messages = [nexus_nitro_llm.create_message("user", "Hello")]
@@ -150,7 +156,7 @@ def benchmark_comparison():
         print("❌ No successful direct calls")
 
 if __name__ == "__main__":
-    main()
+    client = main()
 
     # Uncomment to run benchmark comparison
-    # benchmark_comparison()
\ No newline at end of file
+    # benchmark_comparison(client)
\ No newline at end of file
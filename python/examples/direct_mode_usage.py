@@ -17,6 +17,7 @@ Key benefits of direct mode:
 import asyncio
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 # Configure logging
@@ -54,6 +55,11 @@ class DirectModeProcessor:
                 token=token,
                 timeout=30
             )
+            # Cap the async client's requests in flight. The idle pool keeps its
+            # default size: over HTTP/1.1 each concurrent request needs a connection
+            self.config.set_max_concurrent_streams(100)
+            # Connect at client creation so the first request measures steady state
+            self.config.set_prewarm(True)
 
             # Create clients (no HTTP overhead)
             self.sync_client = PyLightLLMClient(self.config)
@@ -75,17 +81,15 @@ class DirectModeProcessor:
     def sync_request(self, prompt: str, max_tokens: int = 100) -> Dict[str, Any]:
         """Send a synchronous direct request."""
         
-        messages = [nexus_nitro_llm.create_message("user", prompt)]
+        # Timed here: last_latency_ms() is one value per client, which
+        # overlapping calls from other threads overwrite
+        start_time = time.perf_counter()
+        # Single-prompt fast path: no message objects or list to build
+        response = self.sync_client.complete(prompt, max_tokens, 0.7)
+        elapsed = (time.perf_counter() - start_time) * 1000
         
-        start_time = time.time()
-        response = self.sync_client.chat_completions(
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=0.7
-        )
-        elapsed = (time.time() - start_time) * 1000
-        
-        logger.info(f"⚡ Direct sync request completed in {elapsed:.1f}ms")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("⚡ Direct sync request completed in %.1fms", elapsed)
         return response
 
     async def async_request(self, prompt: str, max_tokens: int = 100) -> Dict[str, Any]:
@@ -93,38 +97,41 @@ class DirectModeProcessor:
         
         messages = [nexus_nitro_llm.create_message("user", prompt)]
         
-        start_time = time.time()
+        # Timed here: concurrent awaits on the client overwrite last_latency_ms()
+        start_time = time.perf_counter()
         response = await self.async_client.chat_completions_async(
             messages=messages,
             max_tokens=max_tokens,
             temperature=0.7
         )
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.perf_counter() - start_time) * 1000
         
-        logger.info(f"⚡ Direct async request completed in {elapsed:.1f}ms")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("⚡ Direct async request completed in %.1fms", elapsed)
         return response
 
     async def concurrent_requests(self, prompts: List[str], max_tokens: int = 50) -> List[Dict[str, Any]]:
         """Process multiple requests concurrently in direct mode."""
         
-        logger.info(f"🔄 Processing {len(prompts)} direct requests concurrently...")
+        logger.info("🔄 Processing %d direct requests concurrently...", len(prompts))
         start_time = time.time()
         
-        # Create tasks for concurrent execution
-        tasks = [
-            self.async_request(prompt, max_tokens)
-            for prompt in prompts
-        ]
-        
-        # Execute all requests concurrently
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        # One await for the whole batch; the prompts go to Rust as plain
+        # strings and each request runs as its own tokio task
+        responses = await self.async_client.chat_completions_bulk_async(
+            prompts,
+            max_tokens=max_tokens,
+            temperature=0.7
+        )
         
         elapsed = (time.time() - start_time) * 1000
         successful_responses = [r for r in responses if not isinstance(r, Exception)]
         
-        logger.info(f"✅ Direct concurrent processing completed: {len(successful_responses)} responses in {elapsed:.1f}ms")
-        logger.info(f"   Average per request: {elapsed/len(prompts):.1f}ms")
-        logger.info(f"   Throughput: {len(prompts)/(elapsed/1000):.1f} requests/second")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Direct concurrent processing completed: %d responses in %.1fms",
+                        len(successful_responses), elapsed)
+            logger.info("   Average per request: %.1fms", elapsed / len(prompts))
+            logger.info("   Throughput: %.1f requests/second", len(prompts) / (elapsed / 1000))
         
         return successful_responses
 
@@ -155,6 +162,29 @@ class DirectModeProcessor:
         
         logger.info(f"Direct mode results: {len(direct_responses)} responses in {direct_time:.1f}ms")
         logger.info(f"Direct mode throughput: {len(prompts)/(direct_time/1000):.1f} requests/second")
+
+        # The sync client releases the GIL during each request, so the same
+        # calls made from threads overlap instead of running one after another
+        logger.info("Testing direct mode from threads...")
+
+        def timed_request(prompt: str):
+            # Each worker times its own call; the client's last_latency_ms()
+            # is shared by all threads and would report whichever finished last
+            call_start = time.perf_counter()
+            response = self.sync_client.complete(prompt, 30, 0.7)
+            return response, (time.perf_counter() - call_start) * 1000
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            results = list(executor.map(timed_request, prompts))
+        threaded_time = (time.time() - start_time) * 1000
+        threaded_responses = [response for response, _ in results]
+        call_latencies = [latency for _, latency in results]
+        
+        logger.info(f"Threaded results: {len(threaded_responses)} responses in {threaded_time:.1f}ms")
+        logger.info(f"Per-call latency: avg {sum(call_latencies)/len(call_latencies):.1f}ms, "
+                    f"max {max(call_latencies):.1f}ms")
+        logger.info(f"Threaded throughput: {len(prompts)/(threaded_time/1000):.1f} requests/second")
         logger.info(f"Direct mode advantages:")
         logger.info(f"  • Zero HTTP overhead")
         logger.info(f"  • Direct memory access")
@@ -173,6 +203,9 @@ class DirectModeProcessor:
         logger.info(f"   Connection pooling: {stats.get('connection_pooling', False)}")
         logger.info(f"   Direct mode: {stats.get('lightllm_url', '') == 'direct'}")
 
+        latency = self.sync_client.latency_percentiles()
+        logger.info(f"   Latency p50/p95/p99: {latency['p50']:.1f}/{latency['p95']:.1f}/{latency['p99']:.1f}ms")
+
 
 async def main():
     """Main direct mode demonstration."""
@@ -267,7 +300,7 @@ async def benchmark_direct_mode():
     
     for size in request_sizes:
         logger.info(f"\nTesting {size} concurrent direct requests...")
-        prompts = [f"Test prompt {i}" for i in range(size)]
+        prompts = nexus_nitro_llm.benchmark_prompts("Test prompt ", size)
         
         try:
             start_time = time.time()
@@ -13,6 +13,7 @@ Modes:
 import asyncio
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 # Configure logging
@@ -50,8 +51,6 @@ class ModeComparison:
             timeout=30
         )
         self.http_config.set_connection_pooling(True)
-        self.http_client = PyLightLLMClient(self.http_config)
-        self.http_async_client = PyAsyncLightLLMClient(self.http_config)
 
         # Direct Mode Configuration
         self.direct_config = PyConfig(
@@ -60,8 +59,23 @@ class ModeComparison:
             token=None,
             timeout=30
         )
-        self.direct_client = PyLightLLMClient(self.direct_config)
-        self.direct_async_client = PyAsyncLightLLMClient(self.direct_config)
+
+        # Client constructors release the GIL, so building all four from
+        # threads overlaps their runtime and HTTP client setup
+        specs = [
+            (PyLightLLMClient, self.http_config),
+            (PyAsyncLightLLMClient, self.http_config),
+            (PyLightLLMClient, self.direct_config),
+            (PyAsyncLightLLMClient, self.direct_config),
+        ]
+        with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+            futures = [executor.submit(cls, config) for cls, config in specs]
+            (
+                self.http_client,
+                self.http_async_client,
+                self.direct_client,
+                self.direct_async_client,
+            ) = [future.result() for future in futures]
 
         logger.info("🚀 Mode comparison initialized")
         logger.info("   HTTP Mode: Traditional proxy with HTTP communication")
@@ -131,63 +145,40 @@ class ModeComparison:
         logger.info(f"⚡ Async Direct mode request completed in {elapsed:.1f}ms")
         return response
 
-    def performance_comparison(self):
-        """Compare performance between HTTP and Direct modes."""
-        
-        logger.info("\n📈 Performance Comparison: HTTP vs Direct Mode")
-        logger.info("=" * 60)
-        
-        prompts = [
-            "What is artificial intelligence?",
-            "Explain machine learning briefly.",
-            "What are neural networks?",
-            "Define deep learning.",
-            "What is natural language processing?",
-        ]
-        
-        # Test HTTP mode
-        logger.info("\n🌐 Testing HTTP Mode...")
-        http_times = []
-        for prompt in prompts:
-            start_time = time.time()
-            try:
-                self.test_http_mode(prompt, max_tokens=30)
-                elapsed = (time.time() - start_time) * 1000
-                http_times.append(elapsed)
-            except Exception as e:
-                logger.warning(f"HTTP mode request failed: {e}")
-                http_times.append(float('inf'))
+    async def _run_concurrently(self, request, prompts: List[str], max_concurrent: int):
+        """Send all prompts at once, at most max_concurrent in flight.
         
-        # Test Direct mode
-        logger.info("\n⚡ Testing Direct Mode...")
-        direct_times = []
-        for prompt in prompts:
-            start_time = time.time()
-            try:
-                self.test_direct_mode(prompt, max_tokens=30)
-                elapsed = (time.time() - start_time) * 1000
-                direct_times.append(elapsed)
-            except Exception as e:
-                logger.warning(f"Direct mode request failed: {e}")
-                direct_times.append(float('inf'))
+        Returns the latencies (ms) of the successful requests and the wall time (ms).
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
         
-        # Calculate statistics
-        http_avg = sum(t for t in http_times if t != float('inf')) / len([t for t in http_times if t != float('inf')])
-        direct_avg = sum(t for t in direct_times if t != float('inf')) / len([t for t in direct_times if t != float('inf')])
+        async def timed(prompt: str) -> Optional[float]:
+            # Failures are handled per prompt so they don't cancel the others
+            async with semaphore:
+                start_time = time.time()
+                try:
+                    await request(prompt, max_tokens=30)
+                except Exception as e:
+                    logger.warning(f"Request failed: {e}")
+                    return None
+                return (time.time() - start_time) * 1000
         
-        logger.info(f"\n📊 Performance Results:")
-        logger.info(f"   HTTP Mode Average: {http_avg:.1f}ms")
-        logger.info(f"   Direct Mode Average: {direct_avg:.1f}ms")
-        if direct_avg < http_avg:
-            speedup = http_avg / direct_avg
-            logger.info(f"   Direct Mode Speedup: {speedup:.1f}x faster")
+        start_time = time.time()
+        # Every task is submitted before the first await, so requests overlap
+        if hasattr(asyncio, "TaskGroup"):  # Python 3.11+
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(timed(prompt)) for prompt in prompts]
+            results = [task.result() for task in tasks]
         else:
-            logger.info(f"   HTTP Mode is faster (likely due to network conditions)")
+            results = await asyncio.gather(*(timed(prompt) for prompt in prompts))
+        elapsed = (time.time() - start_time) * 1000
+        
+        return [r for r in results if r is not None], elapsed
 
-    async def async_performance_comparison(self):
-        """Compare async performance between HTTP and Direct modes."""
+    async def async_performance_comparison(self, max_concurrent: int = 10):
+        """Compare concurrent throughput between HTTP and Direct modes."""
         
-        logger.info("\n📈 Async Performance Comparison: HTTP vs Direct Mode")
+        logger.info("\n📈 Performance Comparison: HTTP vs Direct Mode")
         logger.info("=" * 60)
         
         prompts = [
@@ -198,39 +189,27 @@ class ModeComparison:
             "What is natural language processing?",
         ]
         
-        # Test async HTTP mode
-        logger.info("\n🌐 Testing Async HTTP Mode...")
-        start_time = time.time()
-        try:
-            http_tasks = [self.test_async_http_mode(prompt, max_tokens=30) for prompt in prompts]
-            http_responses = await asyncio.gather(*http_tasks, return_exceptions=True)
-            http_elapsed = (time.time() - start_time) * 1000
-            http_successful = len([r for r in http_responses if not isinstance(r, Exception)])
-            logger.info(f"   HTTP Mode: {http_successful} responses in {http_elapsed:.1f}ms")
-        except Exception as e:
-            logger.warning(f"Async HTTP mode failed: {e}")
-            http_elapsed = float('inf')
-        
-        # Test async Direct mode
-        logger.info("\n⚡ Testing Async Direct Mode...")
-        start_time = time.time()
-        try:
-            direct_tasks = [self.test_async_direct_mode(prompt, max_tokens=30) for prompt in prompts]
-            direct_responses = await asyncio.gather(*direct_tasks, return_exceptions=True)
-            direct_elapsed = (time.time() - start_time) * 1000
-            direct_successful = len([r for r in direct_responses if not isinstance(r, Exception)])
-            logger.info(f"   Direct Mode: {direct_successful} responses in {direct_elapsed:.1f}ms")
-        except Exception as e:
-            logger.warning(f"Async Direct mode failed: {e}")
-            direct_elapsed = float('inf')
+        results = {}
+        for name, icon, request in (
+            ("HTTP", "🌐", self.test_async_http_mode),
+            ("Direct", "⚡", self.test_async_direct_mode),
+        ):
+            logger.info(f"\n{icon} Testing {name} Mode...")
+            latencies, elapsed = await self._run_concurrently(request, prompts, max_concurrent)
+            results[name] = elapsed if latencies else float('inf')
+            if latencies:
+                logger.info(f"   {name} Mode: {len(latencies)} responses in {elapsed:.1f}ms")
+                logger.info(f"   {name} Mode average latency: {sum(latencies) / len(latencies):.1f}ms")
+                logger.info(f"   {name} Mode throughput: {len(latencies) / (elapsed / 1000):.1f} requests/second")
         
-        # Calculate statistics
-        if direct_elapsed < http_elapsed and direct_elapsed != float('inf'):
+        http_elapsed, direct_elapsed = results["HTTP"], results["Direct"]
+        logger.info(f"\n📊 Performance Results:")
+        if direct_elapsed < http_elapsed:
             speedup = http_elapsed / direct_elapsed
-            logger.info(f"\n📊 Async Performance Results:")
             logger.info(f"   Direct Mode Speedup: {speedup:.1f}x faster")
+        elif http_elapsed < direct_elapsed:
+            logger.info(f"   HTTP Mode is faster (likely due to network conditions)")
         else:
-            logger.info(f"\n📊 Async Performance Results:")
             logger.info(f"   Both modes performed similarly")
 
     def get_mode_statistics(self):
@@ -328,10 +307,7 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Async Direct mode request failed: {e}")
     
-    # Performance comparison
-    comparison.performance_comparison()
-    
-    # Async performance comparison
+    # Performance comparison (requests in flight concurrently)
     await comparison.async_performance_comparison()
     
     # Get statistics
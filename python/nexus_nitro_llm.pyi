@@ -49,6 +49,12 @@ class PyConfig:
     def set_model_id(self, model_id: str) -> None: ...
     def set_token(self, token: str) -> None: ...
     def set_connection_pooling(self, enabled: bool) -> None: ...
+    def set_max_connections(self, max_connections: int) -> None: ...  # idle connections kept per host
+    def set_http2_prior_knowledge(self, enabled: bool) -> None: ...
+    def set_max_concurrent_streams(self, max_streams: int) -> None: ...
+    def set_response_cache(self, capacity: int, ttl_secs: int) -> None: ...
+    def set_prewarm(self, enabled: bool) -> None: ...
+    def set_worker_threads(self, worker_threads: int) -> None: ...
 
 class PyMessage:
     """Message for chat completions."""
@@ -63,11 +69,47 @@ class PyMessage:
     
     def set_content(self, content: str) -> None: ...
 
+class PyChatResponse(Dict[str, Any]):
+    """Chat completion response; a dict with the assistant text pre-extracted."""
+    
+    @property
+    def content(self) -> str: ...
+    
+    @property
+    def choices(self) -> List[Dict[str, Any]]: ...
+
+class PyResponseBytes:
+    """Raw JSON body of a chat completion; supports memoryview() without copying."""
+    
+    def content_str(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
+
+class PyStreamChunk:
+    """One chunk of a streamed response; supports memoryview() without copying."""
+    
+    def __len__(self) -> int: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
+
+class PyByteStream:
+    """Async iterator over the raw chunks of a streamed chat completion."""
+    
+    def __aiter__(self) -> "PyByteStream": ...
+    async def __anext__(self) -> PyStreamChunk: ...
+
 class PyNexusNitroLLMClient:
     """High-performance LightLLM client."""
     
     def __init__(self, config: PyConfig) -> None: ...
     
+    def clone_with(
+        self,
+        *,
+        backend_url: str = ...,
+        model_id: str = ...,
+        token: str = ...
+    ) -> "PyNexusNitroLLMClient": ...
+    
     def chat_completions(
         self,
         messages: List[PyMessage],
@@ -75,8 +117,46 @@ class PyNexusNitroLLMClient:
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         stream: bool = False
-    ) -> Dict[str, Any]: ...
+    ) -> PyChatResponse: ...
+    
+    def complete(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        model: Optional[str] = None
+    ) -> PyChatResponse: ...
+    
+    def chat_completions_raw(
+        self,
+        messages: List[PyMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> PyResponseBytes: ...
+    
+    def chat_completions_bulk(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_concurrent: int = 10
+    ) -> List[Union[PyChatResponse, NexusNitroLLMError]]: ...
+    
+    def chat_completions_batch(
+        self,
+        messages_list: List[List[PyMessage]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_concurrent: int = 10
+    ) -> List[Union[PyChatResponse, NexusNitroLLMError]]: ...
     
+    def last_latency_ms(self) -> float: ...
+    def latency_percentiles(self) -> Dict[str, Union[int, float]]: ...  # count is an int
+    def recent_latencies_us(self) -> bytes: ...
+    def cache_stats(self) -> Optional[Dict[str, Any]]: ...
     def get_stats(self) -> Dict[str, Any]: ...
     def get_performance_metrics(self) -> Dict[str, Any]: ...
     def test_connection(self) -> bool: ...
@@ -95,6 +175,42 @@ class PyAsyncNexusNitroLLMClient:
         stream: bool = False
     ) -> Any: ...  # Returns a coroutine
     
+    def chat_completion_content_only(
+        self,
+        messages: List[PyMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> Any: ...  # Returns a coroutine yielding the reply text
+    
+    def chat_completions_many(
+        self,
+        messages_list: List[List[PyMessage]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_concurrent: int = 10
+    ) -> Any: ...  # Returns a coroutine yielding responses (or exceptions) in order
+    
+    def chat_completions_bulk_async(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> Any: ...  # Returns a coroutine yielding responses (or exceptions) in order
+    
+    def chat_completions_stream(
+        self,
+        messages: List[PyMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> PyByteStream: ...
+    
+    def last_latency_ms(self) -> float: ...
+    def latency_percentiles(self) -> Dict[str, Union[int, float]]: ...  # count is an int
+    def recent_latencies_us(self) -> bytes: ...
     def get_stats(self) -> Dict[str, Any]: ...
     def test_connection_async(self) -> Any: ...  # Returns a coroutine
 
@@ -143,6 +259,8 @@ def create_async_client(
 
 def create_message(role: str, content: str) -> PyMessage: ...
 
+def benchmark_prompts(prefix: str, n: int) -> List[str]: ...
+
 def create_config(
     backend_url: Optional[str] = None,
     backend_type: Optional[str] = None,
@@ -6,18 +6,95 @@ Addresses all performance failure modes:
 - Single deadline propagated to all operations
 - Proper streaming with backpressure
 - Bounded concurrency with asyncio.Semaphore
-- Memory-efficient buffer reuse
 """
 
 import asyncio
+import functools
+import itertools
 import json
+import math
+import random
+import re
+import secrets
 import time
-import uuid
-from typing import Dict, List, Optional, AsyncGenerator, Any
+from typing import Dict, List, Optional, AsyncGenerator, AsyncIterator, Any, Callable
 from dataclasses import dataclass
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
+try:
+    import orjson
+except ImportError:  # stdlib json is the fallback
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # only needed for transport="httpx_h2"
+    httpx = None
+
+
+# Payload of each "data: " line in an SSE frame (tolerates CRLF line endings)
+_SSE_DATA_RE = re.compile(rb"^data: (.*?)\r?$", re.M)
+
+
+@functools.lru_cache(maxsize=32)
+def _timeout_for(total: float) -> ClientTimeout:
+    """Shared ClientTimeout per total; callers round up to 0.1 s so values repeat
+    
+    Rounding up keeps total above 0, which aiohttp would read as no timeout.
+    """
+    return ClientTimeout(total=total)
+
+
+class RateLimitError(Exception):
+    """Backend answered 429; retry_after is its Retry-After in seconds, if given"""
+    
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"{status} Rate Limited")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class ServerError(Exception):
+    """Backend answered with a 5xx status"""
+    
+    def __init__(self, status: int):
+        super().__init__(f"5xx Server Error: {status}")
+        self.status = status
+
+
+class ClientStatusError(Exception):
+    """Backend rejected the request with a 4xx status other than 429; not retried"""
+    
+    def __init__(self, status: int):
+        super().__init__(f"Client Error: {status}")
+        self.status = status
+
+
+class TransportError(Exception):
+    """Connection-level failure (refused, reset, bad response framing); not retried"""
+
+
+# Deadlines further ahead than this are taken to be wall-clock times by mistake
+_MAX_DEADLINE_AHEAD = 86400.0
+
+# Bytes buffered for one SSE event before the stream is rejected
+_MAX_SSE_FRAME = 1 << 20
+
+
+async def _split_sse_frames(chunks: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """Split a response body into SSE frames at blank lines, LF or CRLF framed"""
+    pending = b''
+    async for chunk in chunks:
+        # A CR split from its LF stays at the end of pending until the LF arrives
+        *frames, pending = (pending + chunk).replace(b'\r\n', b'\n').split(b'\n\n')
+        for frame in frames:
+            yield frame
+        if len(pending) > _MAX_SSE_FRAME:
+            raise TransportError(f"Stream failed: SSE event larger than {_MAX_SSE_FRAME} bytes")
+    if pending:
+        yield pending
+
 
 @dataclass
 class ClientConfig:
@@ -28,47 +105,87 @@ class ClientConfig:
     retry_attempts: int = 3
     retry_base_delay: float = 0.1
     max_retry_delay: float = 5.0
-
-
-class BufferPool:
-    """Memory-efficient buffer pool to avoid allocations"""
-    
-    def __init__(self, max_size: int = 10):
-        self.pool: List[bytearray] = []
-        self.max_size = max_size
-    
-    def get(self) -> bytearray:
-        if self.pool:
-            buffer = self.pool.pop()
-            buffer.clear()
-            return buffer
-        return bytearray(8192)
-    
-    def return_buffer(self, buffer: bytearray) -> None:
-        if len(buffer) <= 65536 and len(self.pool) < self.max_size:
-            buffer.clear()
-            self.pool.append(buffer)
+    use_orjson: bool = True  # Ignored when orjson is not installed
+    body_cache_size: int = 0  # > 0 reuses serialized bodies of repeated conversations
+    # "aiohttp" (HTTP/1.1, one connection per in-flight request) or "httpx_h2"
+    # (HTTP/2, requests multiplexed over one connection; needs httpx[http2])
+    transport: str = "aiohttp"
 
 
 class PerformanceClient:
-    """High-performance LLM client with all optimizations"""
+    """High-performance LLM client with all optimizations
+    
+    The client is bound to whichever asyncio loop runs it; running under
+    uvloop (``uvloop.run(main())``) cuts the per-request loop overhead.
+    """
     
     def __init__(self, config: Optional[ClientConfig] = None):
         self.config = config or ClientConfig()
+        if self.config.transport not in ("aiohttp", "httpx_h2"):
+            raise ValueError(f"Unknown transport: {self.config.transport!r}")
+        if self.config.transport == "httpx_h2" and httpx is None:
+            raise ImportError("transport='httpx_h2' requires httpx: pip install 'httpx[http2]'")
+        
         self.semaphore = asyncio.Semaphore(self.config.max_concurrent)
-        self.buffer_pool = BufferPool()
         self._session: Optional[ClientSession] = None
+        self._post: Optional[Callable[..., Any]] = None  # self._session.post, bound once
+        self._h2_client: Optional["httpx.AsyncClient"] = None  # transport="httpx_h2"
+        # Deadlines are absolute times on this loop's monotonic clock
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Request URL and static headers are built once, not per request
+        self._completions_url = f"{self.config.base_url}/v1/chat/completions"
+        self._base_headers = {'Content-Type': 'application/json'}
+        
+        # Idempotency keys: one random prefix per client plus a counter
+        self._key_prefix = f"py-{int(time.time() * 1000)}-{secrets.token_hex(4)}"
+        self._key_counter = itertools.count()
+        
+        # Private generator for retry jitter
+        self._random = random.Random()
+        
+        # Bodies go out and come back as bytes; orjson.JSONDecodeError
+        # subclasses json.JSONDecodeError, so error handling is shared
+        self._loads: Callable[[bytes], Any]
+        self._dumps: Callable[[Any], bytes]
+        if orjson is not None and self.config.use_orjson:
+            self._loads = orjson.loads
+            self._dumps = orjson.dumps
+        else:
+            self._loads = json.loads
+            self._dumps = lambda obj: json.dumps(obj).encode()
+        
+        # Benchmarks resend the same prompts; cache their request bodies
+        self._body_cache = None
+        if self.config.body_cache_size > 0:
+            self._body_cache = functools.lru_cache(maxsize=self.config.body_cache_size)(
+                lambda key, stream: self._build_body([dict(items) for items in key], stream)
+            )
     
     async def __aenter__(self):
-        await self._ensure_session()
+        self._loop = asyncio.get_running_loop()
+        if self.config.transport == "httpx_h2":
+            self._ensure_h2_client()
+        else:
+            await self._ensure_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self._session:
             await self._session.close()
+        if self._h2_client is not None:
+            await self._h2_client.aclose()
+        self._session = None
+        self._post = None
+        self._h2_client = None
+        self._loop = None
     
     async def _ensure_session(self) -> None:
-        """Create optimized HTTP session with connection pooling"""
+        """Create optimized HTTP session with connection pooling
+        
+        Only called from __aenter__; the request methods expect the session
+        to exist and skip this check.
+        """
         if self._session is None or self._session.closed:
             # Connection pooling with keep-alive
             connector = TCPConnector(
@@ -91,217 +208,316 @@ class PerformanceClient:
                 timeout=timeout,
                 headers={'Connection': 'keep-alive'}
             )
+            self._post = self._session.post
+    
+    def _ensure_h2_client(self) -> None:
+        """Create the HTTP/2 client; concurrent requests share its connection
+        
+        Only called from __aenter__, like _ensure_session.
+        """
+        if self._h2_client is None:
+            limits = httpx.Limits(
+                max_connections=self.config.max_concurrent,
+                max_keepalive_connections=self.config.max_concurrent,
+                keepalive_expiry=self.config.keep_alive,
+            )
+            self._h2_client = httpx.AsyncClient(
+                http2=True,
+                limits=limits,
+                timeout=httpx.Timeout(self.config.timeout, connect=5.0),
+            )
     
     async def chat_completion(
         self, 
         messages: List[Dict[str, str]], 
         deadline: float
     ) -> Dict[str, Any]:
-        """Make chat completion request with deadline and concurrency control"""
+        """Make chat completion request with deadline and concurrency control
+        
+        deadline is absolute on the event loop clock, e.g. ``loop.time() + 10``;
+        a wall-clock deadline raises ValueError.
+        """
+        assert self._loop is not None, "use 'async with PerformanceClient(...)'"
+        self._check_deadline(deadline)
         async with self.semaphore:  # Bound concurrency
-            await self._ensure_session()
-            
-            # Check deadline
-            if time.time() > deadline:
-                raise asyncio.TimeoutError("Deadline exceeded")
-            
-            remaining_time = deadline - time.time()
             idempotency_key = self._generate_idempotency_key()
+            data = self._request_body(messages)
             
-            body = {
-                "model": "test-model",
-                "messages": messages,
-                "max_tokens": 100
-            }
-            
-            return await self._make_request_with_retries(body, remaining_time, idempotency_key)
+            return await self._make_request_with_retries(data, deadline, idempotency_key)
     
     async def stream_chat_completion(
         self, 
         messages: List[Dict[str, str]], 
         deadline: float
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream chat completion with backpressure control"""
+        """Stream chat completion with backpressure control
+        
+        deadline is absolute on the event loop clock, e.g. ``loop.time() + 10``;
+        a wall-clock deadline raises ValueError.
+        """
+        assert self._loop is not None, "use 'async with PerformanceClient(...)'"
+        self._check_deadline(deadline)
         async with self.semaphore:
-            await self._ensure_session()
             
-            if time.time() > deadline:
+            remaining_time = deadline - self._loop.time()
+            if remaining_time <= 0:
                 raise asyncio.TimeoutError("Deadline exceeded")
             
-            remaining_time = deadline - time.time()
             idempotency_key = self._generate_idempotency_key()
+            data = self._request_body(messages, stream=True)
             
-            body = {
-                "model": "test-model",
-                "messages": messages,
-                "max_tokens": 100,
-                "stream": True
-            }
-            
-            async for chunk in self._stream_request(body, remaining_time, idempotency_key):
+            async for chunk in self._stream_request(data, remaining_time, idempotency_key):
                 yield chunk
     
+    def _check_deadline(self, deadline: float) -> None:
+        """Reject deadlines more than a day ahead of the loop clock
+        
+        A wall-clock deadline (``time.time() + 10``) would otherwise lie decades
+        ahead on the loop clock and never expire.
+        """
+        assert self._loop is not None
+        if deadline - self._loop.time() > _MAX_DEADLINE_AHEAD:
+            raise ValueError(
+                f"deadline {deadline} is more than {_MAX_DEADLINE_AHEAD:.0f} s ahead of the "
+                "event loop clock; pass loop.time() + seconds, not time.time() + seconds"
+            )
+    
+    def _request_body(self, messages: List[Dict[str, str]], stream: bool = False) -> bytes:
+        """Serialized request body, from the body cache when it is enabled"""
+        if self._body_cache is not None:
+            try:
+                return self._body_cache(tuple(tuple(m.items()) for m in messages), stream)
+            except TypeError:  # Unhashable message values are serialized every time
+                pass
+        return self._build_body(messages, stream)
+    
+    def _build_body(self, messages: List[Dict[str, str]], stream: bool) -> bytes:
+        """Serialize a chat completion request body"""
+        body = {
+            "model": "test-model",
+            "messages": messages,
+            "max_tokens": 100
+        }
+        if stream:
+            body["stream"] = True
+        return self._dumps(body)
+    
     async def _make_request_with_retries(
         self, 
-        body: Dict[str, Any], 
-        remaining_time: float, 
+        data: bytes, 
+        deadline: float, 
         idempotency_key: str
     ) -> Dict[str, Any]:
         """Make request with retries and deadline enforcement"""
         attempt = 0
-        last_error = None
-        start_time = time.time()
+        last_error: Optional[Exception] = None
+        backoff = None
+        assert self._loop is not None, "use 'async with PerformanceClient(...)'"
+        loop_time = self._loop.time
         
         while attempt < self.config.retry_attempts:
             attempt += 1
             
-            elapsed = time.time() - start_time
-            if elapsed >= remaining_time:
+            remaining_time = deadline - loop_time()
+            if remaining_time <= 0:
                 raise asyncio.TimeoutError("Deadline exceeded")
             
-            attempt_timeout = remaining_time - elapsed
-            
             try:
-                response_data = await self._make_single_request(body, attempt_timeout, idempotency_key)
-                return json.loads(response_data)
-            except Exception as error:
+                # The attempt is cancelled by the loop's timer at the deadline
+                response_data = await asyncio.wait_for(
+                    self._make_single_request(data, idempotency_key), remaining_time
+                )
+                return self._loads(response_data)
+            except RateLimitError as error:
                 last_error = error
                 
-                if "429" in str(error):
-                    # Rate limited - respect Retry-After
-                    retry_after = 1.0  # Default
-                    if hasattr(error, 'headers') and 'retry-after' in error.headers:
-                        retry_after = float(error.headers['retry-after'])
-                    
-                    if elapsed + retry_after >= remaining_time:
-                        raise asyncio.TimeoutError("Deadline exceeded")
-                    
-                    await asyncio.sleep(retry_after)
-                    continue
+                # Rate limited - respect Retry-After
+                retry_after = error.retry_after if error.retry_after is not None else 1.0
+                if loop_time() + retry_after >= deadline:
+                    raise asyncio.TimeoutError("Deadline exceeded")
                 
-                if "5xx" in str(error) or isinstance(error, asyncio.TimeoutError):
-                    # Retry on server errors and timeouts
-                    backoff = self._calculate_backoff(attempt)
-                    if elapsed + backoff >= remaining_time:
-                        raise asyncio.TimeoutError("Deadline exceeded")
-                    
-                    await asyncio.sleep(backoff)
-                    continue
+                await asyncio.sleep(retry_after)
+            except (ServerError, asyncio.TimeoutError) as error:
+                last_error = error
+                
+                # Retry on server errors and timeouts
+                backoff = self._calculate_backoff(backoff)
+                if loop_time() + backoff >= deadline:
+                    raise asyncio.TimeoutError("Deadline exceeded")
                 
-                # Don't retry on client errors (4xx except 429)
-                raise error
+                await asyncio.sleep(backoff)
+            # ClientStatusError and TransportError propagate without a retry
         
         raise last_error or Exception("Max retries exceeded")
     
     async def _make_single_request(
         self, 
-        body: Dict[str, Any], 
-        timeout: float, 
+        data: bytes, 
         idempotency_key: str
-    ) -> str:
-        """Make single HTTP request with timeout"""
-        url = f"{self.config.base_url}/v1/chat/completions"
+    ) -> bytes:
+        """Make single HTTP request; the caller bounds it by the deadline"""
+        headers = {**self._base_headers, 'Idempotency-Key': idempotency_key}
         
-        headers = {
-            'Content-Type': 'application/json',
-            'Idempotency-Key': idempotency_key
-        }
+        h2_client = self._h2_client
+        if h2_client is not None:
+            return await self._h2_request(h2_client, data, headers)
         
+        post = self._post
+        assert post is not None, "use 'async with PerformanceClient(...)'"
         try:
-            async with self._session.post(
-                url, 
-                json=body, 
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=timeout)
+            async with post(
+                self._completions_url, 
+                data=data, 
+                headers=headers
             ) as response:
                 if response.status >= 200 and response.status < 300:
-                    return await response.text()
-                elif response.status == 429:
-                    raise Exception(f"429 Rate Limited")
-                elif response.status >= 500:
-                    raise Exception(f"5xx Server Error: {response.status}")
-                else:
-                    raise Exception(f"Client Error: {response.status}")
+                    return await response.read()
+                raise self._status_error(response.status, response.headers)
         except asyncio.TimeoutError:
             raise asyncio.TimeoutError("Request timeout")
-        except Exception as e:
-            raise Exception(f"Request failed: {e}")
+        except aiohttp.ClientError as e:
+            raise TransportError(f"Request failed: {e}") from e
+    
+    async def _h2_request(
+        self, 
+        client: "httpx.AsyncClient", 
+        data: bytes, 
+        headers: Dict[str, str]
+    ) -> bytes:
+        """_make_single_request over the HTTP/2 client"""
+        try:
+            response = await client.post(self._completions_url, content=data, headers=headers)
+        except httpx.TimeoutException:
+            raise asyncio.TimeoutError("Request timeout")
+        except httpx.TransportError as e:
+            raise TransportError(f"Request failed: {e}") from e
+        
+        if response.status_code >= 200 and response.status_code < 300:
+            return response.content
+        raise self._status_error(response.status_code, response.headers)
     
     async def _stream_request(
         self, 
-        body: Dict[str, Any], 
+        data: bytes, 
         timeout: float, 
         idempotency_key: str
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream request with backpressure control"""
-        url = f"{self.config.base_url}/v1/chat/completions"
+        headers = {**self._base_headers, 'Idempotency-Key': idempotency_key}
         
-        headers = {
-            'Content-Type': 'application/json',
-            'Idempotency-Key': idempotency_key
-        }
+        h2_client = self._h2_client
+        if h2_client is not None:
+            frames = self._h2_frames(h2_client, data, headers, timeout)
+        else:
+            frames = self._aiohttp_frames(data, headers, timeout)
         
         try:
-            async with self._session.post(
-                url, 
-                json=body, 
+            async for frame in frames:
+                for event in self._parse_sse_events(frame):
+                    if event == b'[DONE]':
+                        return
+                    
+                    try:
+                        yield self._loads(event)
+                    except json.JSONDecodeError:
+                        # Skip malformed JSON
+                        pass
+        finally:
+            # Releases the response when [DONE] arrives before end of stream
+            await frames.aclose()
+    
+    async def _aiohttp_frames(
+        self, 
+        data: bytes, 
+        headers: Dict[str, str], 
+        timeout: float
+    ) -> AsyncGenerator[bytes, None]:
+        """SSE frames of a streamed response over the aiohttp session"""
+        post = self._post
+        assert post is not None, "use 'async with PerformanceClient(...)'"
+        try:
+            async with post(
+                self._completions_url, 
+                data=data, 
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=timeout)
+                timeout=_timeout_for(math.ceil(timeout * 10) / 10)
             ) as response:
                 if response.status < 200 or response.status >= 300:
-                    raise Exception(f"HTTP {response.status}")
-                
-                buffer = self.buffer_pool.get()
-                current_data = ''
+                    raise self._status_error(response.status, response.headers)
                 
-                try:
-                    async for chunk in response.content.iter_chunked(1024):
-                        buffer.extend(chunk)
-                        current_data += chunk.decode('utf-8', errors='ignore')
-                        
-                        # Parse SSE events with backpressure
-                        events = self._parse_sse_events(current_data)
-                        for event in events:
-                            if event.get('data') == '[DONE]':
-                                return
-                            
-                            try:
-                                json_data = json.loads(event['data'])
-                                yield json_data
-                            except json.JSONDecodeError:
-                                # Skip malformed JSON
-                                pass
-                finally:
-                    self.buffer_pool.return_buffer(buffer)
+                # Framed from raw chunks, so no line length limit applies
+                async for frame in _split_sse_frames(response.content.iter_any()):
+                    yield frame
                     
         except asyncio.TimeoutError:
             raise asyncio.TimeoutError("Stream timeout")
-        except Exception as e:
-            raise Exception(f"Stream failed: {e}")
+        except (aiohttp.ClientError, aiohttp.http_exceptions.HttpProcessingError, ValueError) as e:
+            # HttpProcessingError covers LineTooLong, which is not a ClientError
+            raise TransportError(f"Stream failed: {e}") from e
     
-    def _parse_sse_events(self, text: str) -> List[Dict[str, str]]:
-        """Parse Server-Sent Events efficiently"""
-        events = []
-        lines = text.split('\n')
-        current_event = {}
-        
-        for line in lines:
-            if line.startswith('data: '):
-                current_event['data'] = line[6:]
-                events.append(current_event)
-                current_event = {}
-        
-        return events
+    async def _h2_frames(
+        self, 
+        client: "httpx.AsyncClient", 
+        data: bytes, 
+        headers: Dict[str, str], 
+        timeout: float
+    ) -> AsyncGenerator[bytes, None]:
+        """SSE frames of a streamed response over the HTTP/2 client"""
+        try:
+            async with client.stream(
+                "POST", 
+                self._completions_url, 
+                content=data, 
+                headers=headers, 
+                timeout=timeout
+            ) as response:
+                if response.status_code < 200 or response.status_code >= 300:
+                    raise self._status_error(response.status_code, response.headers)
+                
+                async for frame in _split_sse_frames(response.aiter_bytes()):
+                    yield frame
+                    
+        except httpx.TimeoutException:
+            raise asyncio.TimeoutError("Stream timeout")
+        except httpx.TransportError as e:
+            raise TransportError(f"Stream failed: {e}") from e
     
-    def _calculate_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff with jitter"""
-        delay = self.config.retry_base_delay * (2 ** (attempt - 1))
-        jitter = delay * 0.1 * (0.5 - 0.5)  # Simplified jitter
-        return min(delay + jitter, self.config.max_retry_delay)
+    def _status_error(self, status: int, headers: Any) -> Exception:
+        """Typed exception for a non-2xx response"""
+        if status == 429:
+            return RateLimitError(429, self._parse_retry_after(headers.get('Retry-After')))
+        if status >= 500:
+            return ServerError(status)
+        return ClientStatusError(status)
+    
+    def _parse_sse_events(self, event: bytes) -> List[bytes]:
+        """Extract the data payloads of one complete Server-Sent Event"""
+        return _SSE_DATA_RE.findall(event)
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After in seconds; None when absent or given as an HTTP date"""
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+    
+    def _calculate_backoff(self, prev_sleep: Optional[float] = None) -> float:
+        """Calculate backoff with decorrelated jitter
+        
+        Each sleep is drawn between the base delay and three times the previous
+        sleep, so concurrent clients retrying together spread out instead of
+        reconnecting in lockstep.
+        """
+        base = self.config.retry_base_delay
+        upper = max(base, (prev_sleep or base) * 3)
+        return min(self.config.max_retry_delay, self._random.uniform(base, upper))
     
     def _generate_idempotency_key(self) -> str:
         """Generate unique idempotency key"""
-        return f"py-{int(time.time() * 1000)}-{uuid.uuid4().hex[:9]}"
+        return f"{self._key_prefix}-{next(self._key_counter)}"
 
 
 # Example usage and test
@@ -311,7 +527,7 @@ async def smoke_test():
     
     async with PerformanceClient(config) as client:
         messages = [{"role": "user", "content": "Hello"}]
-        deadline = time.time() + 10.0  # 10 second deadline
+        deadline = asyncio.get_running_loop().time() + 10.0  # 10 second deadline
         
         try:
             # Test regular completion
@@ -328,7 +544,12 @@ async def smoke_test():
 
 
 if __name__ == "__main__":
-    asyncio.run(smoke_test())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(smoke_test())
+    else:
+        uvloop.run(smoke_test())
 
 
 
@@ -31,14 +31,18 @@ async def test_python_streaming():
         chunk_count = 0
         async for chunk in stream:
             chunk_count += 1
-            if chunk and 'choices' in chunk and len(chunk['choices']) > 0:
-                delta = chunk['choices'][0].get('delta', {})
-                content = delta.get('content', '')
+            choices = chunk.get('choices') if chunk else None
+            if choices:
+                # Look up the first choice once; chunks without a delta or
+                # content are skipped without building fallback dicts
+                choice = choices[0]
+                delta = choice.get('delta')
+                content = delta.get('content') if delta else None
                 if content:
                     print(f"Chunk {chunk_count}: '{content.strip()}'")
 
                 # Check if this is the final chunk
-                finish_reason = chunk['choices'][0].get('finish_reason')
+                finish_reason = choice.get('finish_reason')
                 if finish_reason == 'stop':
                     print(f"✓ Stream completed with finish_reason: {finish_reason}")
                     break
@@ -53,7 +57,12 @@ async def test_python_streaming():
     return True
 
 if __name__ == "__main__":
-    success = asyncio.run(test_python_streaming())
+    try:
+        import uvloop
+    except ImportError:
+        success = asyncio.run(test_python_streaming())
+    else:
+        success = uvloop.run(test_python_streaming())
     if success:
         print("\n🎉 All Python streaming tests passed!")
     else:
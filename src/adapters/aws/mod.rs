@@ -386,6 +386,10 @@ impl AdapterTrait for AWSBedrockAdapter {
         self.access_key_id.is_some() && self.secret_access_key.is_some()
     }
 
+    fn http_client(&self) -> Option<&Client> {
+        Some(&self.client)
+    }
+
     #[cfg(feature = "server")]
     async fn chat_completions(&self, request: ChatCompletionRequest) -> Result<ChatCompletionResponse, ProxyError> {
         let http_response = self.chat_completions_http(request).await?;
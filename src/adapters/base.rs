@@ -53,6 +53,11 @@ pub trait AdapterTrait: Send + Sync {
     /// Check if the adapter has authentication configured
     fn has_auth(&self) -> bool;
 
+    /// HTTP client used to reach the backend, if the adapter makes HTTP calls
+    fn http_client(&self) -> Option<&Client> {
+        None
+    }
+
     /// Process a chat completion request
     async fn chat_completions(
         &self,
@@ -114,6 +119,89 @@ impl AdapterUtils {
         Ok(())
     }
 
+    /// Parse an endpoint URL once so requests don't re-parse it
+    ///
+    /// Returns `None` when the URL doesn't parse; callers then fall back to
+    /// the formatted string so reqwest reports the error per request as before.
+    pub fn endpoint_url(base: &str, path: &str) -> Option<reqwest::Url> {
+        reqwest::Url::parse(&format!("{}{}", base, path)).ok()
+    }
+
+    /// Append `value` to `out` as a JSON string literal
+    ///
+    /// Produces the same bytes as serde_json. Eight bytes are checked at a time
+    /// for quotes, backslashes and control characters, so runs of plain text
+    /// are copied with one `extend_from_slice` instead of byte by byte.
+    pub fn write_json_str(out: &mut Vec<u8>, value: &str) {
+        const ONES: u64 = 0x0101_0101_0101_0101;
+        const HIGH: u64 = 0x8080_8080_8080_8080;
+        const HEX: &[u8; 16] = b"0123456789abcdef";
+
+        let bytes = value.as_bytes();
+        out.reserve(bytes.len() + 2);
+        out.push(b'"');
+
+        // `start` is the first byte not yet copied to `out`
+        let mut start = 0;
+        let mut i = 0;
+        while i < bytes.len() {
+            if let Some(chunk) = bytes.get(i..i + 8) {
+                let word = u64::from_le_bytes(chunk.try_into().unwrap_or_default());
+                let quote = word ^ (ONES * b'"' as u64);
+                let backslash = word ^ (ONES * b'\\' as u64);
+                // High bit set in a lane that is below 0x20 or equal to zero
+                let special = (word.wrapping_sub(ONES * 0x20) & !word)
+                    | (quote.wrapping_sub(ONES) & !quote)
+                    | (backslash.wrapping_sub(ONES) & !backslash);
+                if special & HIGH == 0 {
+                    i += 8;
+                    continue;
+                }
+            }
+
+            let byte = bytes[i];
+            if byte >= 0x20 && byte != b'"' && byte != b'\\' {
+                i += 1;
+                continue;
+            }
+
+            out.extend_from_slice(&bytes[start..i]);
+            match byte {
+                b'"' => out.extend_from_slice(b"\\\""),
+                b'\\' => out.extend_from_slice(b"\\\\"),
+                b'\n' => out.extend_from_slice(b"\\n"),
+                b'\r' => out.extend_from_slice(b"\\r"),
+                b'\t' => out.extend_from_slice(b"\\t"),
+                0x08 => out.extend_from_slice(b"\\b"),
+                0x0c => out.extend_from_slice(b"\\f"),
+                _ => out.extend_from_slice(&[
+                    b'\\', b'u', b'0', b'0',
+                    HEX[(byte >> 4) as usize],
+                    HEX[(byte & 0xf) as usize],
+                ]),
+            }
+            i += 1;
+            start = i;
+        }
+
+        out.extend_from_slice(&bytes[start..]);
+        out.push(b'"');
+    }
+
+    /// Serialize a request body into a buffer sized for it up front
+    ///
+    /// The body is handed to the HTTP client and freed with the request, so
+    /// it can't be pooled; sizing it from the message text instead avoids
+    /// serde_json growing the buffer from 128 bytes by repeated doubling.
+    pub fn serialize_request(request: &ChatCompletionRequest) -> Result<bytes::Bytes, ProxyError> {
+        let estimate = 256 + request.messages.iter()
+            .map(|message| 64 + message.role.len() + message.content.as_ref().map_or(0, String::len))
+            .sum::<usize>();
+        let mut body = Vec::with_capacity(estimate);
+        serde_json::to_writer(&mut body, request).map_err(|e| ProxyError::Serialization(e.to_string()))?;
+        Ok(body.into())
+    }
+
     /// Extract model from request or use default
     pub fn extract_model(request: &ChatCompletionRequest, default_model: &str) -> String {
         request.model.clone().unwrap_or_else(|| default_model.to_string())
@@ -203,4 +291,43 @@ mod tests {
 
         assert_eq!(AdapterUtils::extract_model(&request_no_model, "default"), "default");
     }
+
+    #[test]
+    fn test_write_json_str_matches_serde() {
+        let long = format!("{}\"{}", "x".repeat(10_000), "y".repeat(7));
+        let cases = [
+            "",
+            "plain ascii text",
+            "quote \" and backslash \\",
+            "tabs\tnew\nlines\r\n",
+            "control \u{0} \u{1} \u{8} \u{c} \u{1f} \u{7f}",
+            "unicode: é 漢字 🦀",
+            long.as_str(),
+        ];
+
+        for case in cases {
+            let mut out = Vec::new();
+            AdapterUtils::write_json_str(&mut out, case);
+            assert_eq!(out, serde_json::to_vec(case).unwrap(), "{:?}", case);
+        }
+    }
+
+    #[test]
+    fn test_serialize_request_matches_serde() {
+        let request = ChatCompletionRequest {
+            messages: vec![Message {
+                role: "user".to_string(),
+                content: Some("x".repeat(4096)),
+                name: None,
+                tool_calls: None,
+                function_call: None,
+                tool_call_id: None,
+            }],
+            model: Some("test-model".to_string()),
+            ..Default::default()
+        };
+
+        let body = AdapterUtils::serialize_request(&request).unwrap();
+        assert_eq!(&body[..], &serde_json::to_vec(&request).unwrap()[..]);
+    }
 }
\ No newline at end of file
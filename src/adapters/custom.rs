@@ -34,16 +34,29 @@ pub struct CustomAdapter {
     token: Option<String>,
     /// HTTP client with connection pooling
     client: Client,
+    /// Chat completions endpoint, parsed once at construction
+    chat_url: Option<reqwest::Url>,
 }
 
 impl CustomAdapter {
     /// Create a new Custom adapter instance
     pub fn new(base_url: String, model_id: String, token: Option<String>, client: Client) -> Self {
+        let chat_url = AdapterUtils::endpoint_url(&base_url, "/chat/completions");
         Self {
             base_url,
             model_id,
             token,
             client,
+            chat_url,
+        }
+    }
+
+    /// Start a POST to the chat completions endpoint
+    #[cfg(feature = "server")]
+    fn post_chat_completions(&self) -> reqwest::RequestBuilder {
+        match &self.chat_url {
+            Some(url) => self.client.post(url.clone()),
+            None => self.client.post(format!("{}/chat/completions", self.base_url)),
         }
     }
 
@@ -62,25 +75,36 @@ impl CustomAdapter {
         &self.token
     }
 
-    /// Process chat completion requests
+    /// Send a chat completion request and return the successful response body
     #[cfg(feature = "server")]
-    pub async fn chat_completions_http(
+    async fn send_chat_completions(
         &self,
-        req: ChatCompletionRequest,
-    ) -> Result<Response, ProxyError> {
-        AdapterUtils::log_request(
-            "custom",
-            &AdapterUtils::extract_model(&req, &self.model_id),
-            req.messages.len(),
-        );
+        req: &ChatCompletionRequest,
+    ) -> Result<bytes::Bytes, ProxyError> {
+        let body = AdapterUtils::serialize_request(req)?;
+        let model_name = AdapterUtils::extract_model(req, &self.model_id);
+        self.send_chat_completions_body(&model_name, req.messages.len(), body).await
+    }
 
-        let start_time = std::time::Instant::now();
+    /// Send an already-serialized chat completion request body
+    ///
+    /// `model_name` and `message_count` are only used for logging.
+    #[cfg(feature = "server")]
+    pub async fn send_chat_completions_body(
+        &self,
+        model_name: &str,
+        message_count: usize,
+        body: bytes::Bytes,
+    ) -> Result<bytes::Bytes, ProxyError> {
+        AdapterUtils::log_request("custom", model_name, message_count);
 
-        // Build the endpoint URL - assume OpenAI-compatible
-        let url = format!("{}/chat/completions", self.base_url);
+        let start_time = std::time::Instant::now();
 
-        // Forward the request to the custom endpoint
-        let mut request_builder = self.client.post(url).json(&req);
+        // Forward the request to the custom endpoint (assumed OpenAI-compatible)
+        let mut request_builder = self
+            .post_chat_completions()
+            .header(reqwest::header::CONTENT_TYPE, "application/json")
+            .body(body);
 
         // Add authentication header if token is present
         if let Some(token) = &self.token {
@@ -104,7 +128,7 @@ impl CustomAdapter {
         let response_time = start_time.elapsed().as_millis() as u64;
         AdapterUtils::log_response(
             "custom",
-            &AdapterUtils::extract_model(&req, &self.model_id),
+            model_name,
             status.is_success(),
             response_time,
         );
@@ -118,6 +142,42 @@ impl CustomAdapter {
             )));
         }
 
+        Ok(response_bytes)
+    }
+
+    /// Send an already-serialized request body and decode the typed response
+    #[cfg(feature = "server")]
+    pub async fn chat_completions_body(
+        &self,
+        model_name: &str,
+        message_count: usize,
+        body: bytes::Bytes,
+    ) -> Result<ChatCompletionResponse, ProxyError> {
+        let body_bytes = self.send_chat_completions_body(model_name, message_count, body).await?;
+        Self::decode_response(&body_bytes)
+    }
+
+    /// Parse a successful response body into a ChatCompletionResponse
+    #[cfg(feature = "server")]
+    fn decode_response(body_bytes: &[u8]) -> Result<ChatCompletionResponse, ProxyError> {
+        serde_json::from_slice(body_bytes).map_err(|e| {
+            debug!("Failed to parse custom endpoint JSON response: {}", e);
+            ProxyError::Upstream(format!(
+                "error decoding response body: {} (body: {})",
+                e,
+                String::from_utf8_lossy(body_bytes)
+            ))
+        })
+    }
+
+    /// Process chat completion requests
+    #[cfg(feature = "server")]
+    pub async fn chat_completions_http(
+        &self,
+        req: ChatCompletionRequest,
+    ) -> Result<Response, ProxyError> {
+        let response_bytes = self.send_chat_completions(&req).await?;
+
         let json = serde_json::from_slice::<serde_json::Value>(&response_bytes).map_err(|e| {
             debug!("Failed to parse custom endpoint JSON response: {}", e);
             ProxyError::Upstream(format!(
@@ -142,8 +202,7 @@ impl CustomAdapter {
 
         let start_time = Instant::now();
 
-        let url = format!("{}/chat/completions", self.base_url);
-        let mut request_builder = self.client.post(url).json(&req);
+        let mut request_builder = self.post_chat_completions().json(&req);
 
         if let Some(token) = &self.token {
             request_builder = request_builder.header("Authorization", format!("Bearer {}", token));
@@ -194,23 +253,20 @@ impl AdapterTrait for CustomAdapter {
         self.token.is_some()
     }
 
+    fn http_client(&self) -> Option<&Client> {
+        Some(&self.client)
+    }
+
     #[cfg(feature = "server")]
     async fn chat_completions(
         &self,
         request: ChatCompletionRequest,
     ) -> Result<ChatCompletionResponse, ProxyError> {
-        let http_response = self.chat_completions_http(request).await?;
-
-        // Extract the response body
-        let body_bytes = axum::body::to_bytes(http_response.into_body(), usize::MAX)
-            .await
-            .map_err(|e| ProxyError::Internal(format!("Failed to read response body: {}", e)))?;
-
-        // Parse the JSON response into ChatCompletionResponse
-        let response: ChatCompletionResponse = serde_json::from_slice(&body_bytes)
-            .map_err(|e| ProxyError::Internal(format!("Failed to parse response JSON: {}", e)))?;
+        let body_bytes = self.send_chat_completions(&request).await?;
 
-        Ok(response)
+        // Decode the upstream body straight into the typed response; going
+        // through chat_completions_http would parse it twice
+        Self::decode_response(&body_bytes)
     }
 
     #[cfg(not(feature = "server"))]
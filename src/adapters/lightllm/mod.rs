@@ -495,6 +495,10 @@ impl AdapterTrait for LightLLMAdapter {
         self.token.is_some()
     }
 
+    fn http_client(&self) -> Option<&Client> {
+        Some(&self.client)
+    }
+
     #[cfg(feature = "server")]
     async fn chat_completions(
         &self,
@@ -77,6 +77,15 @@ impl Adapter {
             .build()
             .unwrap_or_else(|_| HttpClientBuilder::new().build().unwrap());
 
+        Self::with_client(cfg, client)
+    }
+
+    /// Create an adapter for `cfg` that sends through an existing HTTP client
+    ///
+    /// reqwest clients are cheap handles to a shared connection pool, so
+    /// adapters built from the same client reuse each other's connections.
+    /// Client-level settings (timeouts, pool size) come from `client`, not `cfg`.
+    pub fn with_client(cfg: &Config, client: reqwest::Client) -> Self {
         // Intelligent backend detection based on URL patterns
         if cfg.backend_url.contains("azure.com") || cfg.backend_url.contains("azure.openai") {
             // Azure OpenAI Service detected
@@ -226,6 +235,19 @@ impl Adapter {
             Self::Direct(adapter) => adapter.has_auth(),
         }
     }
+
+    /// Get the HTTP client shared by the adapter's requests (None in direct mode)
+    pub fn http_client(&self) -> Option<&reqwest::Client> {
+        match self {
+            Self::LightLLM(adapter) => adapter.http_client(),
+            Self::VLLM(adapter) => adapter.http_client(),
+            Self::AzureOpenAI(adapter) => adapter.http_client(),
+            Self::AWSBedrock(adapter) => adapter.http_client(),
+            Self::OpenAI(adapter) => adapter.http_client(),
+            Self::Custom(adapter) => adapter.http_client(),
+            Self::Direct(adapter) => adapter.http_client(),
+        }
+    }
 }
 
 #[cfg(test)]
@@ -42,16 +42,29 @@ pub struct OpenAIAdapter {
     model_id: String,
     /// Optional authentication token
     token: Option<String>,
+    /// Chat completions endpoint, parsed once at construction
+    chat_url: Option<reqwest::Url>,
 }
 
 impl OpenAIAdapter {
     /// Create a new OpenAI adapter instance
     pub fn new(base: String, model_id: String, token: Option<String>, client: Client) -> Self {
+        let chat_url = AdapterUtils::endpoint_url(&base, "/chat/completions");
         Self {
             base,
             client,
             model_id,
             token,
+            chat_url,
+        }
+    }
+
+    /// Start a POST to the chat completions endpoint
+    #[cfg(feature = "server")]
+    fn post_chat_completions(&self) -> reqwest::RequestBuilder {
+        match &self.chat_url {
+            Some(url) => self.client.post(url.clone()),
+            None => self.client.post(format!("{}/chat/completions", self.base)),
         }
     }
 
@@ -71,8 +84,7 @@ impl OpenAIAdapter {
 
         let start_time = Instant::now();
 
-        let url = format!("{}/chat/completions", self.base);
-        let mut request_builder = self.client.post(url).json(&req);
+        let mut request_builder = self.post_chat_completions().json(&req);
 
         if let Some(token) = &self.token {
             request_builder = request_builder.header("Authorization", format!("Bearer {}", token));
@@ -104,25 +116,36 @@ impl OpenAIAdapter {
         Ok(resp)
     }
 
-    /// Process chat completion requests with direct forwarding
+    /// Send a chat completion request and return the successful response body
     #[cfg(feature = "server")]
-    pub async fn chat_completions_http(
+    async fn send_chat_completions(
         &self,
-        req: ChatCompletionRequest,
-    ) -> Result<Response, ProxyError> {
-        AdapterUtils::log_request(
-            "openai",
-            &AdapterUtils::extract_model(&req, &self.model_id),
-            req.messages.len(),
-        );
+        req: &ChatCompletionRequest,
+    ) -> Result<bytes::Bytes, ProxyError> {
+        let body = AdapterUtils::serialize_request(req)?;
+        let model_name = AdapterUtils::extract_model(req, &self.model_id);
+        self.send_chat_completions_body(&model_name, req.messages.len(), body).await
+    }
 
-        let start_time = std::time::Instant::now();
+    /// Send an already-serialized chat completion request body
+    ///
+    /// `model_name` and `message_count` are only used for logging.
+    #[cfg(feature = "server")]
+    pub async fn send_chat_completions_body(
+        &self,
+        model_name: &str,
+        message_count: usize,
+        body: bytes::Bytes,
+    ) -> Result<bytes::Bytes, ProxyError> {
+        AdapterUtils::log_request("openai", model_name, message_count);
 
-        // Build the OpenAI API endpoint URL
-        let url = format!("{}/chat/completions", self.base);
+        let start_time = std::time::Instant::now();
 
         // Forward the request as-is to the OpenAI-compatible endpoint
-        let mut request_builder = self.client.post(url).json(&req);
+        let mut request_builder = self
+            .post_chat_completions()
+            .header(reqwest::header::CONTENT_TYPE, "application/json")
+            .body(body);
 
         // Add authentication header if token is present
         if let Some(token) = &self.token {
@@ -147,7 +170,7 @@ impl OpenAIAdapter {
         let response_time = start_time.elapsed().as_millis() as u64;
         AdapterUtils::log_response(
             "openai",
-            &AdapterUtils::extract_model(&req, &self.model_id),
+            model_name,
             status.is_success(),
             response_time,
         );
@@ -162,10 +185,46 @@ impl OpenAIAdapter {
             )));
         }
 
+        Ok(response_bytes)
+    }
+
+    /// Send an already-serialized request body and decode the typed response
+    #[cfg(feature = "server")]
+    pub async fn chat_completions_body(
+        &self,
+        model_name: &str,
+        message_count: usize,
+        body: bytes::Bytes,
+    ) -> Result<ChatCompletionResponse, ProxyError> {
+        let body_bytes = self.send_chat_completions_body(model_name, message_count, body).await?;
+        Self::decode_response(&body_bytes)
+    }
+
+    /// Parse a successful response body into a ChatCompletionResponse
+    #[cfg(feature = "server")]
+    fn decode_response(body_bytes: &[u8]) -> Result<ChatCompletionResponse, ProxyError> {
+        serde_json::from_slice(body_bytes).map_err(|e| {
+            debug!("Failed to parse OpenAI JSON response: {}", e);
+            ProxyError::Upstream(format!(
+                "error decoding response body: {} (body: {})",
+                e,
+                String::from_utf8_lossy(body_bytes)
+            ))
+        })
+    }
+
+    /// Process chat completion requests with direct forwarding
+    #[cfg(feature = "server")]
+    pub async fn chat_completions_http(
+        &self,
+        req: ChatCompletionRequest,
+    ) -> Result<Response, ProxyError> {
+        let response_bytes = self.send_chat_completions(&req).await?;
+
         // If streaming was requested, just return the raw response body for the streaming adapter to handle
         if req.stream.unwrap_or(false) {
             let response = Response::builder()
-                .status(status)
+                .status(StatusCode::OK)
                 .body(axum::body::Body::from(response_bytes))
                 .map_err(|e| ProxyError::Internal(format!("Failed to build response: {}", e)))?;
             return Ok(response);
@@ -206,24 +265,20 @@ impl AdapterTrait for OpenAIAdapter {
         self.token.is_some()
     }
 
+    fn http_client(&self) -> Option<&Client> {
+        Some(&self.client)
+    }
+
     #[cfg(feature = "server")]
     async fn chat_completions(
         &self,
         request: ChatCompletionRequest,
     ) -> Result<ChatCompletionResponse, ProxyError> {
-        // Get the HTTP response from the HTTP implementation
-        let http_response = self.chat_completions_http(request).await?;
-
-        // Extract the response body
-        let body_bytes = axum::body::to_bytes(http_response.into_body(), usize::MAX)
-            .await
-            .map_err(|e| ProxyError::Internal(format!("Failed to read response body: {}", e)))?;
-
-        // Parse the JSON response into ChatCompletionResponse
-        let response: ChatCompletionResponse = serde_json::from_slice(&body_bytes)
-            .map_err(|e| ProxyError::Internal(format!("Failed to parse response JSON: {}", e)))?;
+        let body_bytes = self.send_chat_completions(&request).await?;
 
-        Ok(response)
+        // Decode the upstream body straight into the typed response; going
+        // through chat_completions_http would parse it twice
+        Self::decode_response(&body_bytes)
     }
 
     #[cfg(not(feature = "server"))]
@@ -121,6 +121,10 @@ impl AdapterTrait for VLLMAdapter {
         self.token.is_some()
     }
 
+    fn http_client(&self) -> Option<&Client> {
+        Some(&self.client)
+    }
+
     #[cfg(feature = "server")]
     async fn chat_completions(&self, request: ChatCompletionRequest) -> Result<ChatCompletionResponse, ProxyError> {
         // Get the HTTP response from the HTTP implementation
@@ -89,6 +89,13 @@ pub struct Config {
     #[cfg_attr(feature = "cli", arg(long, env = "HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST", default_value = "10"))]
     pub http_client_max_connections_per_host: usize,
 
+    /// Speak HTTP/2 to the backend without negotiation (h2c on plain http://)
+    ///
+    /// Concurrent requests then share multiplexed streams on one connection
+    /// instead of each holding its own. Only for backends that accept HTTP/2.
+    #[cfg_attr(feature = "cli", arg(long, env = "HTTP2_PRIOR_KNOWLEDGE", default_value = "false"))]
+    pub http2_prior_knowledge: bool,
+
     /// Streaming chunk size in bytes
     #[cfg_attr(feature = "cli", arg(long, env = "STREAMING_CHUNK_SIZE", default_value = "1024"))]
     pub streaming_chunk_size: usize,
@@ -319,6 +326,7 @@ impl Config {
             http_client_timeout: 30,
             http_client_max_connections: 100,
             http_client_max_connections_per_host: 10,
+            http2_prior_knowledge: false,
             streaming_chunk_size: 1024,
             streaming_timeout: 300,
             streaming_keep_alive_interval: 30,
@@ -68,7 +68,7 @@ impl From<&Config> for HttpClientConfig {
                 keepalive: Some(Duration::from_secs(60)),
             },
             compression: true,
-            http2_prior_knowledge: false,
+            http2_prior_knowledge: config.http2_prior_knowledge,
         }
     }
 }
@@ -168,7 +168,9 @@ impl HttpClientBuilder {
         }
 
         if self.config.http2_prior_knowledge {
-            builder = builder.http2_prior_knowledge();
+            // Size HTTP/2 flow-control windows from measured bandwidth-delay so
+            // many multiplexed streams aren't throttled by the default window
+            builder = builder.http2_prior_knowledge().http2_adaptive_window(true);
         }
 
         builder.build().map_err(HttpClientError::from)
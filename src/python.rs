@@ -15,16 +15,31 @@
 //! - **Type Safety**: Full type annotations and validation
 
 use crate::{
-    adapters::Adapter,
+    adapters::{base::AdapterUtils, Adapter},
+    caching::{CacheConfig, CacheManager, EvictionStrategy},
     config::Config,
     error::ProxyError,
-    schemas::{ChatCompletionRequest, Message},
+    schemas::{ChatCompletionRequest, ChatCompletionResponse, Message},
 };
+use futures_util::future::join_all;
+use futures_util::stream::{self, StreamExt};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
-use pyo3::exceptions::PyException;
-use std::sync::Arc;
+use pyo3::intern;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyDict, PyList, PyString};
+use pyo3::exceptions::{PyBufferError, PyException, PyStopAsyncIteration};
+use pyo3::ffi;
+use bytes::Bytes;
+use hdrhistogram::Histogram;
+use std::collections::HashMap;
+use std::os::raw::{c_char, c_int, c_void};
+use std::ptr;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, OnceLock, Weak};
+use std::time::{Duration, Instant};
 use tokio::runtime::Runtime;
+use tokio::sync::{mpsc, Semaphore};
+use tokio::task::JoinSet;
 use tracing::{debug, error};
 
 // Note: chrono imports removed as they're not used in current implementation
@@ -34,11 +49,544 @@ pyo3::create_exception!(nexus_nitro_llm, NexusNitroLLMError, PyException);
 pyo3::create_exception!(nexus_nitro_llm, ConnectionError, PyException);
 pyo3::create_exception!(nexus_nitro_llm, ConfigurationError, PyException);
 
-/// Python-accessible configuration for the universal LLM proxy
+/// Cached `loads` callable used to turn response JSON into Python objects
+static JSON_LOADS: GILOnceCell<PyObject> = GILOnceCell::new();
+
+/// Decode a JSON document into Python objects, preferring orjson when installed
+fn json_loads(py: Python<'_>, data: &str) -> PyResult<PyObject> {
+    let loads = JSON_LOADS.get_or_try_init(py, || -> PyResult<PyObject> {
+        let module = py.import("orjson").or_else(|_| py.import("json"))?;
+        Ok(module.getattr("loads")?.to_object(py))
+    })?;
+    loads.call1(py, (data,))
+}
+
+/// Send a request through the adapter's typed (non-HTTP) interface
+async fn dispatch(adapter: &Adapter, request: ChatCompletionRequest) -> Result<ChatCompletionResponse, ProxyError> {
+    use crate::adapters::base::AdapterTrait;
+    match adapter {
+        Adapter::LightLLM(adapter) => adapter.chat_completions(request).await,
+        Adapter::VLLM(adapter) => adapter.chat_completions(request).await,
+        Adapter::OpenAI(adapter) => adapter.chat_completions(request).await,
+        Adapter::AzureOpenAI(adapter) => adapter.chat_completions(request).await,
+        Adapter::AWSBedrock(adapter) => adapter.chat_completions(request).await,
+        Adapter::Custom(adapter) => adapter.chat_completions(request).await,
+        Adapter::Direct(adapter) => adapter.chat_completions(request).await,
+    }
+}
+
+/// Read a Python sequence of PyMessage objects straight into request messages
+///
+/// Used with `from_py_with` so the arguments skip the intermediate
+/// `Vec<PyRef<PyMessage>>` and its allocation.
+fn extract_messages(messages: &PyAny) -> PyResult<Vec<Message>> {
+    let mut out = Vec::with_capacity(messages.len().unwrap_or(0));
+    for item in messages.iter()? {
+        out.push(item?.extract::<PyRef<PyMessage>>()?.inner.clone());
+    }
+    Ok(out)
+}
+
+/// Build a single user message
+fn user_message(content: String) -> Message {
+    Message {
+        role: "user".to_string(),
+        content: Some(content),
+        name: None,
+        tool_calls: None,
+        function_call: None,
+        tool_call_id: None,
+    }
+}
+
+/// Serialize an adapter response to the JSON body handed to Python
+///
+/// Returns the first choice's text alongside the body so callers can expose
+/// it without walking the nested dict/list structure.
+fn serialize_response(response: ChatCompletionResponse) -> PyResult<(String, String)> {
+    let content = response.choices.first()
+        .and_then(|choice| choice.message.content.clone())
+        .unwrap_or_default();
+
+    let choices: Vec<serde_json::Value> = response.choices.into_iter().map(|choice| {
+        serde_json::json!({
+            "index": choice.index,
+            "message": {
+                "role": choice.message.role,
+                "content": choice.message.content.unwrap_or_default()
+            },
+            "finish_reason": choice.finish_reason
+        })
+    }).collect();
+
+    let response_data = serde_json::json!({
+        "id": response.id,
+        "object": response.object,
+        "created": response.created,
+        "model": response.model,
+        "choices": choices,
+        "usage": response.usage
+    });
+
+    let response_str = serde_json::to_string(&response_data)
+        .map_err(|e| NexusNitroLLMError::new_err(
+            format!("Failed to serialize response: {}", e)
+        ))?;
+
+    Ok((content, response_str))
+}
+
+/// Convert an adapter response into the Python dict returned by the clients
+///
+/// The dict is filled straight from the response struct, in the same shape
+/// `serialize_response` writes, instead of serializing to JSON and parsing
+/// that back with `json.loads`.
+fn response_to_py(py: Python<'_>, response: ChatCompletionResponse) -> PyResult<PyObject> {
+    let content = response.choices.first()
+        .and_then(|choice| choice.message.content.clone())
+        .unwrap_or_default();
+
+    // Built at its final size in one go rather than grown by appends
+    let choices = response.choices.into_iter().map(|choice| {
+        let message = PyDict::new(py);
+        message.set_item(intern!(py, "role"), choice.message.role)?;
+        message.set_item(intern!(py, "content"), choice.message.content.unwrap_or_default())?;
+
+        let item = PyDict::new(py);
+        item.set_item(intern!(py, "index"), choice.index)?;
+        item.set_item(intern!(py, "message"), message)?;
+        item.set_item(intern!(py, "finish_reason"), choice.finish_reason)?;
+        Ok(item.to_object(py))
+    }).collect::<PyResult<Vec<PyObject>>>()?;
+    let choices = PyList::new(py, choices);
+
+    let usage = match response.usage {
+        Some(usage) => {
+            let dict = PyDict::new(py);
+            dict.set_item(intern!(py, "prompt_tokens"), usage.prompt_tokens)?;
+            dict.set_item(intern!(py, "completion_tokens"), usage.completion_tokens)?;
+            dict.set_item(intern!(py, "total_tokens"), usage.total_tokens)?;
+            dict.to_object(py)
+        }
+        None => py.None(),
+    };
+
+    let chat_response = Py::new(py, PyChatResponse { content })?;
+    let as_dict: &PyDict = chat_response.as_ref(py).downcast()?;
+    as_dict.set_item(intern!(py, "id"), response.id)?;
+    as_dict.set_item(intern!(py, "object"), response.object)?;
+    as_dict.set_item(intern!(py, "created"), response.created)?;
+    as_dict.set_item(intern!(py, "model"), response.model)?;
+    as_dict.set_item(intern!(py, "choices"), choices)?;
+    as_dict.set_item(intern!(py, "usage"), usage)?;
+    Ok(chat_response.into_py(py))
+}
+
+/// Chat completion response returned to Python
+///
+/// A `dict` subclass, so existing `response["choices"][0]["message"]["content"]`
+/// access keeps working, with the assistant text also exposed directly as
+/// `response.content` (empty string when there is no choice).
+#[pyclass(extends=PyDict)]
+pub struct PyChatResponse {
+    #[pyo3(get)]
+    content: String,
+}
+
+#[pymethods]
+impl PyChatResponse {
+    /// List of choices, same object as `response["choices"]`
+    #[getter]
+    fn choices(self_: &PyCell<Self>) -> PyResult<PyObject> {
+        let py = self_.py();
+        let as_dict: &PyDict = self_.downcast()?;
+        Ok(as_dict.get_item("choices")?.map_or_else(|| py.None(), |choices| choices.to_object(py)))
+    }
+}
+
+/// Fill `view` with a read-only, one-dimensional byte view of `data`
+///
+/// `owner` is the Python object that owns `data`; the view holds a reference
+/// to it so the bytes stay alive until the view is released.
+unsafe fn fill_readonly_buffer(
+    owner: *mut ffi::PyObject,
+    data: &[u8],
+    view: *mut ffi::Py_buffer,
+    flags: c_int,
+) -> PyResult<()> {
+    if view.is_null() {
+        return Err(PyBufferError::new_err("View is null"));
+    }
+    if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+        return Err(PyBufferError::new_err("Response buffer is read-only"));
+    }
+
+    ffi::Py_INCREF(owner);
+    (*view).obj = owner;
+
+    (*view).buf = data.as_ptr() as *mut c_void;
+    (*view).len = data.len() as isize;
+    (*view).readonly = 1;
+    (*view).itemsize = 1;
+    (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+        b"B\0".as_ptr() as *mut c_char
+    } else {
+        ptr::null_mut()
+    };
+    (*view).ndim = 1;
+    (*view).shape = if (flags & ffi::PyBUF_ND) == ffi::PyBUF_ND {
+        &mut (*view).len
+    } else {
+        ptr::null_mut()
+    };
+    (*view).strides = if (flags & ffi::PyBUF_STRIDES) == ffi::PyBUF_STRIDES {
+        &mut (*view).itemsize
+    } else {
+        ptr::null_mut()
+    };
+    (*view).suboffsets = ptr::null_mut();
+    (*view).internal = ptr::null_mut();
+
+    Ok(())
+}
+
+/// Placeholder prompt used to locate the splice point in a request template
+const PROMPT_MARKER: &str = "\u{0}nnllm-prompt\u{0}";
+
+/// Request settings a template was serialized for: model, max_tokens, temperature bits
+type TemplateKey = (String, Option<u32>, Option<u32>);
+
+/// Content of a user message that carries nothing but text
+///
+/// Such a message serializes exactly like `user_message(content)`, so it can
+/// be sent through a `RequestTemplate`.
+fn plain_user_prompt(message: &Message) -> Option<&str> {
+    if message.role != "user"
+        || message.name.is_some()
+        || message.tool_calls.is_some()
+        || message.function_call.is_some()
+        || message.tool_call_id.is_some()
+    {
+        return None;
+    }
+    message.content.as_deref()
+}
+
+/// Serialized single-prompt request body with a hole for the prompt
+///
+/// Everything except the user content is encoded once; each request then
+/// copies the two halves around the JSON-escaped prompt.
+struct RequestTemplate {
+    key: TemplateKey,
+    prefix: Bytes,
+    suffix: Bytes,
+}
+
+impl RequestTemplate {
+    fn new(key: TemplateKey) -> PyResult<Self> {
+        let request = ChatCompletionRequest {
+            model: Some(key.0.clone()),
+            messages: vec![user_message(PROMPT_MARKER.to_owned())],
+            max_tokens: key.1,
+            temperature: key.2.map(f32::from_bits),
+            stream: Some(false),
+            ..Default::default()
+        };
+        let body = serde_json::to_vec(&request)
+            .map_err(|e| NexusNitroLLMError::new_err(format!("Serialization error: {}", e)))?;
+
+        let marker = serde_json::to_vec(PROMPT_MARKER)
+            .map_err(|e| NexusNitroLLMError::new_err(format!("Serialization error: {}", e)))?;
+        let at = body
+            .windows(marker.len())
+            .position(|window| window == marker.as_slice())
+            .ok_or_else(|| NexusNitroLLMError::new_err("Internal error: prompt marker missing from template"))?;
+
+        let body = Bytes::from(body);
+        Ok(Self {
+            key,
+            prefix: body.slice(..at),
+            suffix: body.slice(at + marker.len()..),
+        })
+    }
+
+    /// Request body with `prompt` spliced in as the user message content
+    fn render(&self, prompt: &str) -> Bytes {
+        let mut body = Vec::with_capacity(self.prefix.len() + prompt.len() + 2 + self.suffix.len());
+        body.extend_from_slice(&self.prefix);
+        AdapterUtils::write_json_str(&mut body, prompt);
+        body.extend_from_slice(&self.suffix);
+        Bytes::from(body)
+    }
+}
+
+/// Raw JSON body of a chat completion
+///
+/// Supports the buffer protocol, so `memoryview(resp)` reads the Rust-owned
+/// bytes without a copy; no Python dict is built unless the caller asks for
+/// one with `json.loads(bytes(resp))`.
+#[pyclass]
+pub struct PyResponseBytes {
+    data: Bytes,
+    content: String,
+}
+
+#[pymethods]
+impl PyResponseBytes {
+    /// Assistant text of the first choice (empty string when there is none)
+    fn content_str(&self) -> &str {
+        &self.content
+    }
+
+    fn __len__(&self) -> usize {
+        self.data.len()
+    }
+
+    unsafe fn __getbuffer__(
+        slf: PyRefMut<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        fill_readonly_buffer(slf.as_ptr(), &slf.data, view, flags)
+    }
+
+    unsafe fn __releasebuffer__(&self, _view: *mut ffi::Py_buffer) {}
+}
+
+/// One chunk of a streamed response, readable through the buffer protocol
+///
+/// `memoryview(chunk)` views the bytes received from the backend without
+/// copying them into a Python `str` or `bytes`.
+#[pyclass]
+pub struct PyStreamChunk {
+    data: Bytes,
+}
+
+#[pymethods]
+impl PyStreamChunk {
+    fn __len__(&self) -> usize {
+        self.data.len()
+    }
+
+    unsafe fn __getbuffer__(
+        slf: PyRefMut<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        fill_readonly_buffer(slf.as_ptr(), &slf.data, view, flags)
+    }
+
+    unsafe fn __releasebuffer__(&self, _view: *mut ffi::Py_buffer) {}
+}
+
+/// Chunks forwarded from the upstream body to a Python async iterator
+type ChunkReceiver = Arc<tokio::sync::Mutex<mpsc::Receiver<Result<Bytes, ProxyError>>>>;
+
+/// Number of chunks buffered between the backend and the Python consumer
+const STREAM_CHANNEL_CAPACITY: usize = 32;
+
+/// Async iterator over the raw chunks of a streamed chat completion
 #[pyclass]
+pub struct PyByteStream {
+    receiver: ChunkReceiver,
+}
+
+#[pymethods]
+impl PyByteStream {
+    fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __anext__(&self, py: Python<'_>) -> PyResult<Option<PyObject>> {
+        let receiver = self.receiver.clone();
+        let next = pyo3_asyncio::tokio::future_into_py(py, async move {
+            let item = receiver.lock().await.recv().await;
+            match item {
+                Some(Ok(data)) => Python::with_gil(|py| Ok(Py::new(py, PyStreamChunk { data })?.into_py(py))),
+                Some(Err(e)) => Err(proxy_error_to_py(e)),
+                None => Err(PyStopAsyncIteration::new_err("stream exhausted")),
+            }
+        })?;
+        Ok(Some(next.into()))
+    }
+}
+
+/// Forward the upstream response body chunk by chunk into `sender`
+///
+/// Backends without a raw streaming endpoint send their complete JSON
+/// response as a single chunk.
+async fn stream_upstream(
+    adapter: Arc<Adapter>,
+    request: ChatCompletionRequest,
+    sender: mpsc::Sender<Result<Bytes, ProxyError>>,
+) {
+    let response = match &*adapter {
+        Adapter::LightLLM(adapter) => adapter.stream_chat_completions_raw(request).await,
+        Adapter::OpenAI(adapter) => adapter.stream_chat_completions_raw(request).await,
+        Adapter::Custom(adapter) => adapter.stream_chat_completions_raw(request).await,
+        _ => {
+            let body = dispatch(&adapter, request).await.and_then(|response| {
+                serde_json::to_vec(&response)
+                    .map(Bytes::from)
+                    .map_err(|e| ProxyError::Serialization(e.to_string()))
+            });
+            let _ = sender.send(body).await;
+            return;
+        }
+    };
+
+    // Non-2xx statuses already come back as errors from the raw adapters
+    let response = match response {
+        Ok(response) => response,
+        Err(e) => {
+            let _ = sender.send(Err(e)).await;
+            return;
+        }
+    };
+
+    let mut body = response.bytes_stream();
+    while let Some(chunk) = body.next().await {
+        let chunk = chunk.map_err(|e| ProxyError::Upstream(format!("Stream read failed: {}", e)));
+        let failed = chunk.is_err();
+        // Stop when the consumer went away or the body errored
+        if sender.send(chunk).await.is_err() || failed {
+            break;
+        }
+    }
+}
+
+/// Map Rust errors to typed Python exceptions with context
+fn proxy_error_to_py(e: ProxyError) -> PyErr {
+    match e {
+        ProxyError::Upstream(msg) => {
+            ConnectionError::new_err(format!("Upstream error: {}", msg))
+        }
+        ProxyError::BadRequest(msg) => {
+            NexusNitroLLMError::new_err(format!("Bad request: {}", msg))
+        }
+        ProxyError::Internal(msg) => {
+            NexusNitroLLMError::new_err(format!("Internal error: {}", msg))
+        }
+        ProxyError::Serialization(msg) => {
+            NexusNitroLLMError::new_err(format!("Serialization error: {}", msg))
+        }
+    }
+}
+
+/// Per-client request latency accounting
+///
+/// Latencies are measured around the upstream call on the Rust side. Only
+/// completed calls are recorded: failures and response-cache hits would skew
+/// the percentiles with near-zero samples.
+struct LatencyRecorder {
+    samples: Mutex<LatencySamples>,
+    last_us: AtomicU64,
+}
+
+/// Number of raw samples kept for `recent_latencies_us`
+const RECENT_LATENCIES: usize = 1024;
+
+struct LatencySamples {
+    /// Microsecond latencies, 1µs to 60s at 3 significant figures
+    histogram: Histogram<u64>,
+    /// Ring of the latest microsecond latencies
+    recent: Box<[u64; RECENT_LATENCIES]>,
+    /// Samples recorded so far; the next one goes to `recorded % RECENT_LATENCIES`
+    recorded: usize,
+}
+
+impl LatencyRecorder {
+    fn new() -> Self {
+        Self {
+            samples: Mutex::new(LatencySamples {
+                histogram: Histogram::new_with_bounds(1, 60_000_000, 3).expect("valid histogram bounds"),
+                recent: Box::new([0; RECENT_LATENCIES]),
+                recorded: 0,
+            }),
+            last_us: AtomicU64::new(0),
+        }
+    }
+
+    /// Record the time since `started` if `result` is a completed call
+    fn record_ok<T, E>(&self, started: Instant, result: &Result<T, E>) {
+        if result.is_ok() {
+            self.record(started.elapsed());
+        }
+    }
+
+    fn record(&self, elapsed: Duration) {
+        let us = elapsed.as_micros() as u64;
+        self.last_us.store(us, Ordering::Relaxed);
+        if let Ok(mut samples) = self.samples.lock() {
+            samples.histogram.saturating_record(us.max(1));
+            let slot = samples.recorded % RECENT_LATENCIES;
+            samples.recent[slot] = us;
+            samples.recorded += 1;
+        }
+    }
+
+    /// Latest samples, oldest first, as native-endian u64 microseconds
+    fn recent<'py>(&self, py: Python<'py>) -> PyResult<&'py PyBytes> {
+        let mut raw = Vec::with_capacity(RECENT_LATENCIES * 8);
+        {
+            let samples = self.samples.lock()
+                .map_err(|_| NexusNitroLLMError::new_err("Latency histogram lock poisoned"))?;
+            // Before the first wrap the ring is filled from the start; after it,
+            // the oldest sample sits right after the newest
+            let (head, tail) = if samples.recorded <= RECENT_LATENCIES {
+                (&samples.recent[..0], &samples.recent[..samples.recorded])
+            } else {
+                samples.recent.split_at(samples.recorded % RECENT_LATENCIES)
+            };
+            for us in tail.iter().chain(head) {
+                raw.extend_from_slice(&us.to_ne_bytes());
+            }
+        }
+        Ok(PyBytes::new(py, &raw))
+    }
+
+    fn last_ms(&self) -> f64 {
+        self.last_us.load(Ordering::Relaxed) as f64 / 1000.0
+    }
+
+    fn percentiles(&self, py: Python<'_>) -> PyResult<PyObject> {
+        // Read everything under the lock, then build the dict without it so
+        // requests completing meanwhile don't wait on Python allocations
+        let (count, quantiles, max) = {
+            let samples = self.samples.lock()
+                .map_err(|_| NexusNitroLLMError::new_err("Latency histogram lock poisoned"))?;
+            let histogram = &samples.histogram;
+            let quantiles = [("p50", 0.50), ("p95", 0.95), ("p99", 0.99)]
+                .map(|(key, quantile)| (key, histogram.value_at_quantile(quantile)));
+            (histogram.len(), quantiles, histogram.max())
+        };
+
+        let stats = PyDict::new(py);
+        stats.set_item("count", count)?;
+        for (key, value) in quantiles {
+            stats.set_item(key, value as f64 / 1000.0)?;
+        }
+        stats.set_item("max", max as f64 / 1000.0)?;
+        Ok(stats.to_object(py))
+    }
+}
+
+/// Default cap on requests an async client keeps in flight at once
+const DEFAULT_MAX_CONCURRENT_STREAMS: usize = 100;
+
+/// Python-accessible configuration for the universal LLM proxy
+#[pyclass(freelist = 64, weakref)]
 #[derive(Clone)]
 pub struct PyConfig {
     inner: Config,
+    /// Maximum requests an async client keeps in flight (HTTP/2 streams)
+    max_concurrent_streams: usize,
+    /// Response cache for the sync client; `None` leaves it disabled
+    response_cache: Option<CacheConfig>,
+    /// Open pooled connections when a client is created
+    prewarm: bool,
+    /// Worker threads for the shared runtime; `None` uses one per physical core
+    worker_threads: Option<usize>,
 }
 
 #[pymethods]
@@ -114,7 +662,13 @@ impl PyConfig {
         // Note: validate() is private, so we skip validation for now
         // In production, this should be handled by the Config::new() method
 
-        Ok(Self { inner: config })
+        Ok(Self {
+            inner: config,
+            max_concurrent_streams: DEFAULT_MAX_CONCURRENT_STREAMS,
+            response_cache: None,
+            prewarm: false,
+            worker_threads: None,
+        })
     }
 
     /// Set the backend LLM URL
@@ -124,8 +678,8 @@ impl PyConfig {
 
     /// Get the backend LLM URL
     #[getter]
-    fn backend_url(&self) -> String {
-        self.inner.backend_url.clone()
+    fn backend_url(&self) -> &str {
+        &self.inner.backend_url
     }
 
     /// Set the default model ID
@@ -135,8 +689,8 @@ impl PyConfig {
 
     /// Get the default model ID
     #[getter]
-    fn model_id(&self) -> String {
-        self.inner.model_id.clone()
+    fn model_id(&self) -> &str {
+        &self.inner.model_id
     }
 
     /// Set authentication token
@@ -154,24 +708,155 @@ impl PyConfig {
             self.inner.http_client_max_connections_per_host = 1;
         }
     }
+
+    /// Set how many idle connections are kept pooled per backend host
+    ///
+    /// This sizes the idle pool; it does not cap open connections. Over
+    /// HTTP/1.1 every concurrent request still opens a connection of its own,
+    /// and those beyond this number are closed once idle, so keep it at the
+    /// expected concurrency. With `set_http2_prior_knowledge(True)` one
+    /// connection multiplexes many requests and 1-4 is enough. To bound
+    /// requests in flight on an async client, use `set_max_concurrent_streams`.
+    fn set_max_connections(&mut self, max_connections: usize) -> PyResult<()> {
+        if max_connections == 0 {
+            return Err(ConfigurationError::new_err("Max connections cannot be 0"));
+        }
+        self.inner.http_client_max_connections_per_host = max_connections;
+        self.inner.http_client_max_connections = self.inner.http_client_max_connections.max(max_connections);
+        Ok(())
+    }
+
+    /// Talk HTTP/2 to the backend from the first byte (no HTTP/1.1 upgrade)
+    ///
+    /// Concurrent requests, e.g. a gather() of async calls, then run as
+    /// multiplexed streams on one connection instead of each waiting for a
+    /// connection of its own. Only enable for backends that accept HTTP/2
+    /// (h2c for plain http:// URLs); HTTPS backends negotiate it anyway.
+    fn set_http2_prior_knowledge(&mut self, enabled: bool) {
+        self.inner.http2_prior_knowledge = enabled;
+    }
+
+    /// Cap the number of requests an async client keeps in flight at once
+    ///
+    /// Requests beyond the cap wait on the Rust side instead of opening more
+    /// streams, which keeps large fan-outs from degrading the backend.
+    fn set_max_concurrent_streams(&mut self, max_streams: usize) -> PyResult<()> {
+        if max_streams == 0 {
+            return Err(ConfigurationError::new_err("Max concurrent streams cannot be 0"));
+        }
+        self.max_concurrent_streams = max_streams;
+        Ok(())
+    }
+
+    /// Enable an exact-match response cache in the sync client
+    ///
+    /// Repeated requests with identical model, messages and parameters are
+    /// answered from memory. Only deterministic requests (temperature
+    /// explicitly 0) are cached. A capacity of 0 disables the cache.
+    fn set_response_cache(&mut self, capacity: usize, ttl_secs: u64) -> PyResult<()> {
+        if capacity == 0 {
+            self.response_cache = None;
+            return Ok(());
+        }
+        if ttl_secs == 0 {
+            return Err(ConfigurationError::new_err("Cache TTL cannot be 0"));
+        }
+        self.response_cache = Some(CacheConfig {
+            max_size: capacity,
+            ttl_seconds: ttl_secs,
+            enabled: true,
+            similarity_caching: false,
+            min_response_size: 0,
+            eviction_strategy: EvictionStrategy::LRU,
+        });
+        Ok(())
+    }
+
+    /// Open connections to the backend as soon as a client is created
+    ///
+    /// Up to `max_connections` connections (one with HTTP/2 prior knowledge)
+    /// are opened in the background so the first request does not pay for
+    /// the TCP and TLS handshakes.
+    fn set_prewarm(&mut self, enabled: bool) {
+        self.prewarm = enabled;
+    }
+
+    /// Set the number of worker threads of the runtime shared by all clients
+    ///
+    /// Defaults to the number of physical cores. Only takes effect if no
+    /// client has been created yet in this process.
+    fn set_worker_threads(&mut self, worker_threads: usize) -> PyResult<()> {
+        if worker_threads == 0 {
+            return Err(ConfigurationError::new_err("Worker threads cannot be 0"));
+        }
+        self.worker_threads = Some(worker_threads);
+        Ok(())
+    }
+}
+
+/// Maximum number of recycled string buffers kept for new messages
+const MESSAGE_POOL_CAPACITY: usize = 1024;
+
+/// Buffers larger than this are freed instead of being pooled
+const MESSAGE_POOL_MAX_BUFFER: usize = 64 * 1024;
+
+/// String buffers recycled from dropped messages and reused by new ones
+static MESSAGE_POOL: Mutex<Vec<String>> = Mutex::new(Vec::new());
+
+/// Copy `value` into a recycled buffer when one is available
+fn pooled_string(value: &str) -> String {
+    // An empty String doesn't allocate, so don't take the lock or a buffer for it
+    if value.is_empty() {
+        return String::new();
+    }
+    let recycled = MESSAGE_POOL.lock().ok().and_then(|mut pool| pool.pop());
+    match recycled {
+        Some(mut buffer) => {
+            buffer.clear();
+            buffer.push_str(value);
+            buffer
+        }
+        None => value.to_owned(),
+    }
+}
+
+/// Return a buffer to the pool; skipped on contention or when the pool is full
+fn recycle_string(buffer: String) {
+    if buffer.capacity() == 0 || buffer.capacity() > MESSAGE_POOL_MAX_BUFFER {
+        return;
+    }
+    if let Ok(mut pool) = MESSAGE_POOL.try_lock() {
+        if pool.len() < MESSAGE_POOL_CAPACITY {
+            pool.push(buffer);
+        }
+    }
 }
 
 /// High-performance message structure for Python
-#[pyclass]
+#[pyclass(freelist = 256, weakref)]
 #[derive(Clone)]
 pub struct PyMessage {
     inner: Message,
 }
 
+impl Drop for PyMessage {
+    fn drop(&mut self) {
+        recycle_string(std::mem::take(&mut self.inner.role));
+        if let Some(content) = self.inner.content.take() {
+            recycle_string(content);
+        }
+    }
+}
+
 #[pymethods]
 impl PyMessage {
     /// Create a new message
     #[new]
-    fn new(role: String, content: String) -> Self {
+    fn new(role: &str, content: &str) -> Self {
         Self {
             inner: Message {
-                role,
-                content: Some(content),
+                role: pooled_string(role),
+                content: Some(pooled_string(content)),
                 name: None,
                 tool_calls: None,
                 function_call: None,
@@ -181,20 +866,142 @@ impl PyMessage {
     }
 
     /// Get message role
+    ///
+    /// The standard roles come back as interned strings, so reading them
+    /// allocates no new Python object.
     #[getter]
-    fn role(&self) -> String {
-        self.inner.role.clone()
+    fn role<'py>(&self, py: Python<'py>) -> &'py PyString {
+        match self.inner.role.as_str() {
+            "user" => intern!(py, "user"),
+            "assistant" => intern!(py, "assistant"),
+            "system" => intern!(py, "system"),
+            "tool" => intern!(py, "tool"),
+            other => PyString::new(py, other),
+        }
     }
 
     /// Get message content
     #[getter]
-    fn content(&self) -> String {
-        self.inner.content.clone().unwrap_or_default()
+    fn content(&self) -> &str {
+        self.inner.content.as_deref().unwrap_or_default()
+    }
+
+    /// Set message content, reusing the existing buffer where possible
+    fn set_content(&mut self, content: &str) {
+        match self.inner.content.as_mut() {
+            Some(buffer) => {
+                buffer.clear();
+                buffer.push_str(content);
+            }
+            None => self.inner.content = Some(pooled_string(content)),
+        }
+    }
+}
+
+/// Process-wide tokio runtime shared by the sync and async clients
+static SHARED_RUNTIME: OnceLock<Runtime> = OnceLock::new();
+
+/// Serializes construction of `SHARED_RUNTIME`
+static SHARED_RUNTIME_INIT: Mutex<()> = Mutex::new(());
+
+/// Get the shared multi-thread runtime, building it on first use
+///
+/// The runtime gets `worker_threads` workers (default: one per physical
+/// core) and is installed as pyo3-asyncio's runtime, so blocking sync calls
+/// and awaited coroutines run on the same pool. Once built, later
+/// `worker_threads` values have no effect.
+fn shared_runtime(worker_threads: Option<usize>) -> PyResult<&'static Runtime> {
+    if let Some(runtime) = SHARED_RUNTIME.get() {
+        return Ok(runtime);
+    }
+
+    let _guard = SHARED_RUNTIME_INIT
+        .lock()
+        .map_err(|_| NexusNitroLLMError::new_err("Internal error: runtime lock poisoned"))?;
+    if let Some(runtime) = SHARED_RUNTIME.get() {
+        return Ok(runtime);
+    }
+
+    let runtime = tokio::runtime::Builder::new_multi_thread()
+        .worker_threads(worker_threads.unwrap_or_else(num_cpus::get_physical))
+        .enable_all()
+        .build()
+        .map_err(|e| NexusNitroLLMError::new_err(format!("Failed to create async runtime: {}", e)))?;
+    let runtime = SHARED_RUNTIME.get_or_init(|| runtime);
+
+    // Only fails if pyo3-asyncio already started its own runtime
+    if pyo3_asyncio::tokio::init_with_runtime(runtime).is_err() {
+        debug!("pyo3-asyncio runtime already initialized; async clients use it instead");
+    }
+    Ok(runtime)
+}
+
+/// Backend settings that decide whether two clients can share a backend:
+/// URL, model, token, timeout, total and per-host connection limits and
+/// HTTP/2 mode, i.e. every setting the adapter and its HTTP client are built from
+type BackendKey = (String, String, Option<String>, u64, usize, usize, bool);
+
+/// Adapter (with its HTTP connection pool) per backend, shared by every live
+/// client, sync or async, with the same settings. Only clients hold it
+/// strongly, so a backend's pool and token go away with its last client.
+static SHARED_BACKENDS: OnceLock<Mutex<HashMap<BackendKey, Weak<Adapter>>>> = OnceLock::new();
+
+/// Look up, or create and register, the shared adapter for `config`
+fn shared_backend(config: &Config) -> PyResult<Arc<Adapter>> {
+    let key: BackendKey = (
+        config.backend_url.clone(),
+        config.model_id.clone(),
+        config.backend_token.clone(),
+        config.http_client_timeout,
+        config.http_client_max_connections,
+        config.http_client_max_connections_per_host,
+        config.http2_prior_knowledge,
+    );
+
+    let mut backends = SHARED_BACKENDS
+        .get_or_init(|| Mutex::new(HashMap::new()))
+        .lock()
+        .map_err(|_| NexusNitroLLMError::new_err("Internal error: backend registry lock poisoned"))?;
+
+    // Forget backends whose clients have all been dropped
+    backends.retain(|_, backend| backend.strong_count() > 0);
+    if let Some(adapter) = backends.get(&key).and_then(Weak::upgrade) {
+        return Ok(adapter);
+    }
+
+    let adapter = Arc::new(Adapter::from_config(config));
+    backends.insert(key, Arc::downgrade(&adapter));
+    Ok(adapter)
+}
+
+/// Connections to open when prewarming a client for `config`
+///
+/// With HTTP/2 prior knowledge every request multiplexes over one
+/// connection, so opening more would only leave idle sockets behind.
+fn prewarm_connection_count(config: &Config) -> usize {
+    if config.http2_prior_knowledge {
+        1
+    } else {
+        config.http_client_max_connections_per_host
     }
+}
 
-    /// Set message content
-    fn set_content(&mut self, content: String) {
-        self.inner.content = Some(content);
+/// Open up to `connections` pooled connections to the backend
+///
+/// Concurrent HEAD requests each need their own HTTP/1.1 connection; once
+/// answered, the connections stay idle in the adapter's pool. The response
+/// status is irrelevant, only the handshake matters.
+async fn prewarm_connections(adapter: Arc<Adapter>, connections: usize) {
+    let client = match adapter.http_client() {
+        Some(client) => client,
+        None => return,
+    };
+    let url = adapter.base_url();
+    let warmups = (0..connections.max(1)).map(|_| client.head(url).send());
+    for result in join_all(warmups).await {
+        if let Err(e) = result {
+            debug!("Connection prewarm failed: {}", e);
+        }
     }
 }
 
@@ -202,40 +1009,111 @@ impl PyMessage {
 ///
 /// This provides direct access to multiple LLM backends without HTTP server overhead.
 /// Perfect for embedding in Python applications that need maximum performance.
-#[pyclass]
+#[pyclass(weakref)]
 pub struct PyNexusNitroLLMClient {
-    adapter: Adapter,
-    runtime: Arc<Runtime>,
+    adapter: Arc<Adapter>,
+    runtime: &'static Runtime,
     config: PyConfig,
+    cache: Option<Arc<CacheManager>>,
+    template: Mutex<Option<Arc<RequestTemplate>>>,
     request_count: Arc<std::sync::atomic::AtomicU64>,
     error_count: Arc<std::sync::atomic::AtomicU64>,
+    latency: Arc<LatencyRecorder>,
 }
 
 #[pymethods]
 impl PyNexusNitroLLMClient {
     /// Create a new high-performance universal LLM client
     #[new]
-    fn new(config: PyConfig) -> PyResult<Self> {
-        let runtime = Arc::new(
-            Runtime::new()
-                .map_err(|e| NexusNitroLLMError::new_err(format!("Failed to create async runtime: {}", e)))?
-        );
-
-        let adapter = Adapter::from_config(&config.inner);
+    fn new(py: Python<'_>, config: PyConfig) -> PyResult<Self> {
+        // All clients share one runtime; those with the same backend settings
+        // also share an adapter. Building either is pure Rust work, so the GIL
+        // is released and clients can be constructed from several threads at once.
+        let (runtime, adapter) = py.allow_threads(|| -> PyResult<_> {
+            let runtime = shared_runtime(config.worker_threads)?;
+            Ok((runtime, shared_backend(&config.inner)?))
+        })?;
+        let cache = config.response_cache.clone().map(|cache_config| Arc::new(CacheManager::new(cache_config)));
+
+        if config.prewarm {
+            runtime.spawn(prewarm_connections(adapter.clone(), prewarm_connection_count(&config.inner)));
+        }
 
         Ok(Self { 
             adapter, 
             runtime,
             config,
+            cache,
+            template: Mutex::new(None),
+            request_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
+            error_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
+            latency: Arc::new(LatencyRecorder::new()),
+        })
+    }
+
+    /// Create a client with some settings overridden, sharing this client's backend
+    ///
+    /// The new client reuses this client's runtime and HTTP connection pool;
+    /// only the listed settings change. The response cache is shared only when
+    /// backend_url and token are unchanged. Statistics start at zero.
+    ///
+    /// Args:
+    ///     backend_url: Backend URL
+    ///     model_id: Default model
+    ///     token: Authentication token
+    ///
+    /// Returns:
+    ///     PyNexusNitroLLMClient
+    #[pyo3(signature = (**overrides))]
+    fn clone_with(&self, overrides: Option<&PyDict>) -> PyResult<Self> {
+        let mut config = self.config.clone();
+        if let Some(overrides) = overrides {
+            for (key, value) in overrides.iter() {
+                match key.extract::<&str>()? {
+                    "backend_url" => config.set_backend_url(value.extract()?),
+                    "model_id" => config.set_model_id(value.extract()?),
+                    "token" => config.set_token(value.extract()?),
+                    other => {
+                        return Err(ConfigurationError::new_err(format!(
+                            "Unsupported override '{}' (expected backend_url, model_id or token)",
+                            other
+                        )))
+                    }
+                }
+            }
+        }
+
+        let adapter = match self.adapter.http_client() {
+            Some(client) => Arc::new(Adapter::with_client(&config.inner, client.clone())),
+            None => Arc::new(Adapter::from_config(&config.inner)),
+        };
+
+        // Cached responses are only reused against the same backend and credentials
+        let same_backend = config.inner.backend_url == self.config.inner.backend_url
+            && config.inner.backend_token == self.config.inner.backend_token;
+        let cache = if same_backend {
+            self.cache.clone()
+        } else {
+            config.response_cache.clone().map(|cache_config| Arc::new(CacheManager::new(cache_config)))
+        };
+
+        Ok(Self {
+            adapter,
+            runtime: self.runtime,
+            config,
+            cache,
+            template: Mutex::new(None),
             request_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
             error_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
+            latency: Arc::new(LatencyRecorder::new()),
         })
     }
 
     /// Send a chat completion request and get response directly (no HTTP overhead)
     ///
     /// This method provides maximum performance by bypassing HTTP serialization
-    /// and directly calling the Rust adapter code.
+    /// and directly calling the Rust adapter code. The GIL is released while the
+    /// request is in flight, so calls made from several Python threads overlap.
     ///
     /// Args:
     ///     messages: List of PyMessage objects
@@ -250,7 +1128,7 @@ impl PyNexusNitroLLMClient {
     fn chat_completions(
         &self,
         py: Python,
-        messages: Vec<PyRef<PyMessage>>,
+        #[pyo3(from_py_with = "extract_messages")] messages: Vec<Message>,
         stream: bool,
         model: Option<String>,
         max_tokens: Option<u32>,
@@ -267,7 +1145,7 @@ impl PyNexusNitroLLMClient {
     fn chat_completions_inner(
         &self,
         py: Python,
-        messages: Vec<PyRef<PyMessage>>,
+        messages: Vec<Message>,
         stream: bool,
         model: Option<String>,
         max_tokens: Option<u32>,
@@ -290,16 +1168,39 @@ impl PyNexusNitroLLMClient {
             }
         }
 
-        // Convert Python messages to Rust messages
-        let rust_messages: Vec<Message> = messages.iter().map(|msg| msg.inner.clone()).collect();
-
         // Determine model name early to avoid ownership issues
-        let model_name = model.unwrap_or_else(|| self.config.model_id().clone());
+        let model_name = model.unwrap_or_else(|| self.config.inner.model_id.clone());
+
+        // A lone plain user message has the same shape as complete()'s request,
+        // so it can reuse the pre-serialized template instead of going through serde
+        let cacheable = self.cache.is_some() && temperature.map_or(false, |temp| temp <= 0.0);
+        if !stream && !cacheable && matches!(*self.adapter, Adapter::OpenAI(_) | Adapter::Custom(_)) {
+            if let [message] = messages.as_slice() {
+                if let Some(prompt) = plain_user_prompt(message) {
+                    let template = self.request_template((model_name, max_tokens, temperature.map(f32::to_bits)))?;
+                    let body = template.render(prompt);
+
+                    // CRITICAL: Release GIL for heavy async operations to prevent blocking Python
+                    let result = py.allow_threads(|| self.runtime.block_on(self.dispatch_body(&template.key.0, body)));
+                    return match result {
+                        Ok(response) => response_to_py(py, response).map_err(|e| {
+                            self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                            e
+                        }),
+                        Err(e) => {
+                            self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                            error!("Request failed: {}", e);
+                            Err(proxy_error_to_py(e))
+                        }
+                    };
+                }
+            }
+        }
 
         // Build request
         let request = ChatCompletionRequest {
             model: Some(model_name.clone()),
-            messages: rust_messages,
+            messages,
             max_tokens,
             temperature,
             top_p: None,
@@ -320,82 +1221,365 @@ impl PyNexusNitroLLMClient {
         debug!("Sending chat completion request with {} messages", request.messages.len());
 
         // CRITICAL: Release GIL for heavy async operations to prevent blocking Python
-        let result = py.allow_threads(|| {
-            self.runtime.block_on(async {
-                // Call the trait method that returns ChatCompletionResponse
-                use crate::adapters::base::AdapterTrait;
-                match &self.adapter {
-                    Adapter::LightLLM(adapter) => adapter.chat_completions(request).await,
-                    Adapter::VLLM(adapter) => adapter.chat_completions(request).await,
-                    Adapter::OpenAI(adapter) => adapter.chat_completions(request).await,
-                    Adapter::AzureOpenAI(adapter) => adapter.chat_completions(request).await,
-                    Adapter::AWSBedrock(adapter) => adapter.chat_completions(request).await,
-                    Adapter::Custom(adapter) => adapter.chat_completions(request).await,
-                    Adapter::Direct(adapter) => adapter.chat_completions(request).await,
-                }
-            })
-        });
+        let result = py.allow_threads(|| self.runtime.block_on(self.dispatch_cached(request)));
 
         match result {
             Ok(response) => {
                 debug!("Received successful response from adapter");
-                
-                Python::with_gil(|py| {
-                    // Convert ChatCompletionResponse to Python dict
-                    let choices: Vec<serde_json::Value> = response.choices.into_iter().map(|choice| {
-                        serde_json::json!({
-                            "index": choice.index,
-                            "message": {
-                                "role": choice.message.role,
-                                "content": choice.message.content.unwrap_or_default()
-                            },
-                            "finish_reason": choice.finish_reason
-                        })
-                    }).collect();
-
-                    let response_data = serde_json::json!({
-                        "id": response.id,
-                        "object": response.object,
-                        "created": response.created,
-                        "model": response.model,
-                        "choices": choices,
-                        "usage": response.usage
-                    });
-
-                    let response_str = serde_json::to_string(&response_data)
-                        .map_err(|e| {
-                            self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
-                            NexusNitroLLMError::new_err(
-                                format!("Failed to serialize response: {}", e)
-                            )
-                        })?;
-
-                    let json_module = py.import("json")?;
-                    let py_dict = json_module.call_method1("loads", (response_str,))?;
-                    Ok(py_dict.to_object(py))
+                response_to_py(py, response).map_err(|e| {
+                    self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                    e
                 })
             }
             Err(e) => {
                 self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
                 error!("Request failed: {}", e);
-                
-                // CRITICAL: Map Rust errors to typed Python exceptions with context
-                match e {
-                    ProxyError::Upstream(msg) => {
-                        Err(ConnectionError::new_err(format!("Upstream error: {}", msg)))
-                    }
-                    ProxyError::BadRequest(msg) => {
-                        Err(NexusNitroLLMError::new_err(format!("Bad request: {}", msg)))
-                    }
-                    ProxyError::Internal(msg) => {
-                        Err(NexusNitroLLMError::new_err(format!("Internal error: {}", msg)))
-                    }
-                    ProxyError::Serialization(msg) => {
-                        Err(NexusNitroLLMError::new_err(format!("Serialization error: {}", msg)))
-                    }
+                Err(proxy_error_to_py(e))
+            }
+        }
+    }
+
+    /// Complete a single user prompt
+    ///
+    /// Fast path for the common one-message case: the request is built in Rust
+    /// straight from the prompt, so no PyMessage or messages list is needed.
+    ///
+    /// Args:
+    ///     prompt: User prompt
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///     model: Optional model override
+    ///
+    /// Returns:
+    ///     Dictionary containing the response data
+    #[pyo3(signature = (prompt, max_tokens=None, temperature=None, model=None))]
+    fn complete(
+        &self,
+        py: Python,
+        prompt: &str,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+        model: Option<String>,
+    ) -> PyResult<PyObject> {
+        // Increment request counter
+        self.request_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
+            }
+        }
+
+        let model = model.unwrap_or_else(|| self.config.inner.model_id.clone());
+        let cacheable = self.cache.is_some() && temperature.map_or(false, |temp| temp <= 0.0);
+
+        // OpenAI-compatible backends take the pre-serialized body directly;
+        // cached requests and other backends still go through the typed request
+        let result = if !cacheable && matches!(*self.adapter, Adapter::OpenAI(_) | Adapter::Custom(_)) {
+            let template = self.request_template((model, max_tokens, temperature.map(f32::to_bits)))?;
+            let body = template.render(prompt);
+
+            // CRITICAL: Release GIL for heavy async operations to prevent blocking Python
+            py.allow_threads(|| self.runtime.block_on(self.dispatch_body(&template.key.0, body)))
+        } else {
+            let request = ChatCompletionRequest {
+                model: Some(model),
+                messages: vec![user_message(prompt.to_owned())],
+                max_tokens,
+                temperature,
+                stream: Some(false),
+                ..Default::default()
+            };
+
+            // CRITICAL: Release GIL for heavy async operations to prevent blocking Python
+            py.allow_threads(|| self.runtime.block_on(self.dispatch_cached(request)))
+        };
+
+        match result {
+            Ok(response) => response_to_py(py, response).map_err(|e| {
+                self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                e
+            }),
+            Err(e) => {
+                self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                error!("Request failed: {}", e);
+                Err(proxy_error_to_py(e))
+            }
+        }
+    }
+
+    /// Send a chat completion request and get the raw JSON body back
+    ///
+    /// For hot paths that only need the reply text (`content_str()`) or want to
+    /// forward the JSON as-is; skips building the response dictionary.
+    ///
+    /// Args:
+    ///     messages: List of PyMessage objects
+    ///     model: Optional model override
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///
+    /// Returns:
+    ///     PyResponseBytes exposing the body through the buffer protocol
+    #[pyo3(signature = (messages, model=None, max_tokens=None, temperature=None))]
+    fn chat_completions_raw(
+        &self,
+        py: Python,
+        #[pyo3(from_py_with = "extract_messages")] messages: Vec<Message>,
+        model: Option<String>,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+    ) -> PyResult<PyResponseBytes> {
+        // Increment request counter
+        self.request_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+
+        // Validate input
+        if messages.is_empty() {
+            self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+            return Err(NexusNitroLLMError::new_err("Messages list cannot be empty"));
+        }
+
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
+            }
+        }
+
+        let request = ChatCompletionRequest {
+            model: Some(model.unwrap_or_else(|| self.config.inner.model_id.clone())),
+            messages,
+            max_tokens,
+            temperature,
+            stream: Some(false),
+            ..Default::default()
+        };
+
+        // CRITICAL: Release GIL for the request and the serialization
+        let result = py.allow_threads(|| {
+            let result = self.runtime.block_on(self.dispatch_cached(request));
+            result.map_err(proxy_error_to_py).and_then(serialize_response)
+        });
+
+        match result {
+            Ok((content, body)) => Ok(PyResponseBytes {
+                data: Bytes::from(body.into_bytes()),
+                content,
+            }),
+            Err(e) => {
+                self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                error!("Request failed: {}", e);
+                Err(e)
+            }
+        }
+    }
+
+    /// Send one single-message chat completion per prompt in a single call
+    ///
+    /// Messages are built on the Rust side and all requests run concurrently on
+    /// the client's runtime with the GIL released, so a whole batch costs one
+    /// FFI crossing instead of two per prompt and needs no Python threads.
+    ///
+    /// Args:
+    ///     prompts: List of user prompts
+    ///     model: Optional model override
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///     max_concurrent: Maximum number of requests in flight
+    ///
+    /// Returns:
+    ///     List in prompt order; a failed request is represented by its
+    ///     exception instead of a response dictionary
+    #[pyo3(signature = (prompts, model=None, max_tokens=None, temperature=None, max_concurrent=10))]
+    fn chat_completions_bulk(
+        &self,
+        py: Python,
+        prompts: Vec<String>,
+        model: Option<String>,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+        max_concurrent: usize,
+    ) -> PyResult<Vec<PyObject>> {
+        self.request_count.fetch_add(prompts.len() as u64, std::sync::atomic::Ordering::Relaxed);
+
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(prompts.len() as u64, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
+            }
+        }
+
+        let model_name = model.unwrap_or_else(|| self.config.inner.model_id.clone());
+        let requests: Vec<ChatCompletionRequest> = prompts
+            .into_iter()
+            .map(|prompt| ChatCompletionRequest {
+                model: Some(model_name.clone()),
+                messages: vec![user_message(prompt)],
+                max_tokens,
+                temperature,
+                stream: Some(false),
+                ..Default::default()
+            })
+            .collect();
+
+        debug!("Sending bulk chat completion request with {} prompts", requests.len());
+
+        // CRITICAL: Release GIL while the whole batch is in flight
+        let results: Vec<Result<ChatCompletionResponse, ProxyError>> = py.allow_threads(|| {
+            self.runtime.block_on(
+                stream::iter(requests.into_iter().map(|request| self.dispatch_cached(request)))
+                    .buffered(max_concurrent.max(1))
+                    .collect::<Vec<_>>(),
+            )
+        });
+
+        results
+            .into_iter()
+            .map(|result| match result {
+                Ok(response) => response_to_py(py, response),
+                Err(e) => {
+                    self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                    error!("Bulk request failed: {}", e);
+                    Ok(proxy_error_to_py(e).into_py(py))
                 }
+            })
+            .collect()
+    }
+
+    /// Send several conversations in a single call
+    ///
+    /// The requests run concurrently on the client's runtime with the GIL
+    /// released, so a batch costs one FFI crossing instead of one per
+    /// conversation.
+    ///
+    /// Args:
+    ///     messages_list: One list of PyMessage objects per request
+    ///     model: Optional model override
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///     max_concurrent: Maximum number of requests in flight
+    ///
+    /// Returns:
+    ///     List in request order; a failed request is represented by its
+    ///     exception instead of a response dictionary
+    #[pyo3(signature = (messages_list, model=None, max_tokens=None, temperature=None, max_concurrent=10))]
+    fn chat_completions_batch(
+        &self,
+        py: Python,
+        messages_list: Vec<Vec<PyRef<PyMessage>>>,
+        model: Option<String>,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+        max_concurrent: usize,
+    ) -> PyResult<Vec<PyObject>> {
+        self.request_count.fetch_add(messages_list.len() as u64, std::sync::atomic::Ordering::Relaxed);
+
+        // Validate input
+        if messages_list.iter().any(|messages| messages.is_empty()) {
+            self.error_count.fetch_add(messages_list.len() as u64, std::sync::atomic::Ordering::Relaxed);
+            return Err(NexusNitroLLMError::new_err("Messages list cannot be empty"));
+        }
+
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(messages_list.len() as u64, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
             }
         }
+
+        let model_name = model.unwrap_or_else(|| self.config.inner.model_id.clone());
+        let requests: Vec<ChatCompletionRequest> = messages_list
+            .iter()
+            .map(|messages| ChatCompletionRequest {
+                model: Some(model_name.clone()),
+                messages: messages.iter().map(|msg| msg.inner.clone()).collect(),
+                max_tokens,
+                temperature,
+                stream: Some(false),
+                ..Default::default()
+            })
+            .collect();
+
+        debug!("Sending batch of {} chat completion requests", requests.len());
+
+        // CRITICAL: Release GIL while the whole batch is in flight
+        let results: Vec<Result<ChatCompletionResponse, ProxyError>> = py.allow_threads(|| {
+            self.runtime.block_on(
+                stream::iter(requests.into_iter().map(|request| self.dispatch_cached(request)))
+                    .buffered(max_concurrent.max(1))
+                    .collect::<Vec<_>>(),
+            )
+        });
+
+        results
+            .into_iter()
+            .map(|result| match result {
+                Ok(response) => response_to_py(py, response),
+                Err(e) => {
+                    self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                    error!("Batch request failed: {}", e);
+                    Ok(proxy_error_to_py(e).into_py(py))
+                }
+            })
+            .collect()
+    }
+
+    /// Latency of the most recently completed request, measured in Rust
+    ///
+    /// One value per client: when calls overlap across threads or tasks it may
+    /// belong to another call, so time each call yourself in that case.
+    ///
+    /// Returns:
+    ///     Milliseconds (0.0 before the first request)
+    fn last_latency_ms(&self) -> f64 {
+        self.latency.last_ms()
+    }
+
+    /// Latency percentiles over the completed requests of this client, bulk and batch included
+    ///
+    /// Failed requests and response-cache hits are not counted.
+    ///
+    /// Returns:
+    ///     Dictionary with count, p50, p95, p99 and max in milliseconds
+    fn latency_percentiles(&self, py: Python) -> PyResult<PyObject> {
+        self.latency.percentiles(py)
+    }
+
+    /// Raw latencies of the latest completed requests (up to 1024), oldest first
+    ///
+    /// Read them without a per-sample Python call via
+    /// `memoryview(client.recent_latencies_us()).cast("Q")`.
+    ///
+    /// Returns:
+    ///     bytes of native-endian unsigned 64-bit microsecond values
+    fn recent_latencies_us<'py>(&self, py: Python<'py>) -> PyResult<&'py PyBytes> {
+        self.latency.recent(py)
+    }
+
+    /// Response cache statistics
+    ///
+    /// Returns:
+    ///     Dictionary with hits, misses, hit_rate, size and max_size, or None
+    ///     when the cache is disabled
+    fn cache_stats(&self, py: Python) -> PyResult<PyObject> {
+        let cache = match &self.cache {
+            Some(cache) => cache,
+            None => return Ok(py.None()),
+        };
+        let cache_stats = py.allow_threads(|| self.runtime.block_on(cache.get_stats()));
+
+        let stats = PyDict::new(py);
+        stats.set_item("hits", cache_stats.hits)?;
+        stats.set_item("misses", cache_stats.misses)?;
+        stats.set_item("hit_rate", cache_stats.hit_rate)?;
+        stats.set_item("size", cache_stats.current_size)?;
+        stats.set_item("max_size", cache_stats.max_size)?;
+        Ok(stats.to_object(py))
     }
 
     /// Get comprehensive performance statistics
@@ -407,7 +1591,7 @@ impl PyNexusNitroLLMClient {
             let stats = PyDict::new(py);
             
             // Basic adapter information
-            stats.set_item("adapter_type", match &self.adapter {
+            stats.set_item("adapter_type", match &*self.adapter {
                 Adapter::LightLLM(_) => "lightllm",
                 Adapter::OpenAI(_) => "openai",
                 Adapter::VLLM(_) => "vllm",
@@ -520,75 +1704,473 @@ impl PyNexusNitroLLMClient {
             tool_choice: None,
         };
 
-        // CRITICAL: Release GIL for heavy async operations
-        py.allow_threads(|| {
-            self.runtime.block_on(async {
-                use crate::adapters::base::AdapterTrait;
-                match &self.adapter {
-                    Adapter::LightLLM(adapter) => adapter.chat_completions(request).await.is_ok(),
-                    Adapter::VLLM(adapter) => adapter.chat_completions(request).await.is_ok(),
-                    Adapter::OpenAI(adapter) => adapter.chat_completions(request).await.is_ok(),
-                    Adapter::AzureOpenAI(adapter) => adapter.chat_completions(request).await.is_ok(),
-                    Adapter::AWSBedrock(adapter) => adapter.chat_completions(request).await.is_ok(),
-                    Adapter::Custom(adapter) => adapter.chat_completions(request).await.is_ok(),
-                    Adapter::Direct(adapter) => adapter.chat_completions(request).await.is_ok(),
+        // CRITICAL: Release GIL for heavy async operations
+        py.allow_threads(|| {
+            self.runtime.block_on(async {
+                use crate::adapters::base::AdapterTrait;
+                match &*self.adapter {
+                    Adapter::LightLLM(adapter) => adapter.chat_completions(request).await.is_ok(),
+                    Adapter::VLLM(adapter) => adapter.chat_completions(request).await.is_ok(),
+                    Adapter::OpenAI(adapter) => adapter.chat_completions(request).await.is_ok(),
+                    Adapter::AzureOpenAI(adapter) => adapter.chat_completions(request).await.is_ok(),
+                    Adapter::AWSBedrock(adapter) => adapter.chat_completions(request).await.is_ok(),
+                    Adapter::Custom(adapter) => adapter.chat_completions(request).await.is_ok(),
+                    Adapter::Direct(adapter) => adapter.chat_completions(request).await.is_ok(),
+                }
+            })
+        })
+    }
+}
+
+impl PyNexusNitroLLMClient {
+    /// Dispatch a request, answering deterministic repeats from the response cache
+    async fn dispatch_cached(&self, request: ChatCompletionRequest) -> Result<ChatCompletionResponse, ProxyError> {
+        let cache = match &self.cache {
+            Some(cache) if request.temperature.map_or(false, |temp| temp <= 0.0) => cache,
+            _ => return self.dispatch_timed(request).await,
+        };
+
+        if let Some(response) = cache.get(&request).await {
+            return Ok(response);
+        }
+
+        let response = self.dispatch_timed(request.clone()).await?;
+        cache.put(&request, response.clone()).await?;
+        Ok(response)
+    }
+
+    /// Dispatch a request upstream, recording its latency if it completes
+    async fn dispatch_timed(&self, request: ChatCompletionRequest) -> Result<ChatCompletionResponse, ProxyError> {
+        let started = Instant::now();
+        let result = dispatch(&self.adapter, request).await;
+        self.latency.record_ok(started, &result);
+        result
+    }
+
+    /// Request template for `key`, rebuilt only when the settings change
+    fn request_template(&self, key: TemplateKey) -> PyResult<Arc<RequestTemplate>> {
+        let mut slot = self
+            .template
+            .lock()
+            .map_err(|_| NexusNitroLLMError::new_err("Internal error: request template lock poisoned"))?;
+        if let Some(template) = slot.as_ref().filter(|template| template.key == key) {
+            return Ok(template.clone());
+        }
+        let template = Arc::new(RequestTemplate::new(key)?);
+        *slot = Some(template.clone());
+        Ok(template)
+    }
+
+    /// Send a pre-serialized single-prompt request body
+    async fn dispatch_body(&self, model: &str, body: Bytes) -> Result<ChatCompletionResponse, ProxyError> {
+        let started = Instant::now();
+        let result = match &*self.adapter {
+            Adapter::OpenAI(adapter) => adapter.chat_completions_body(model, 1, body).await,
+            Adapter::Custom(adapter) => adapter.chat_completions_body(model, 1, body).await,
+            _ => Err(ProxyError::Internal("Backend does not accept pre-serialized requests".to_string())),
+        };
+        self.latency.record_ok(started, &result);
+        result
+    }
+}
+
+/// Async-compatible LightLLM client for Python asyncio applications
+///
+/// This client provides async/await support for Python applications that use asyncio.
+/// It properly integrates with Python's event loop without blocking.
+#[pyclass(weakref)]
+pub struct PyAsyncNexusNitroLLMClient {
+    adapter: Arc<Adapter>,
+    config: PyConfig,
+    in_flight: Arc<Semaphore>,
+    request_count: Arc<std::sync::atomic::AtomicU64>,
+    error_count: Arc<std::sync::atomic::AtomicU64>,
+    latency: Arc<LatencyRecorder>,
+    /// `get_stats` result with the fixed entries filled in; copied per call
+    stats_template: Py<PyDict>,
+}
+
+impl PyAsyncNexusNitroLLMClient {
+    /// Build the stats dict once, with zeroed placeholders for the counters
+    ///
+    /// The placeholders keep the key order of the per-call copies stable when
+    /// `get_stats` overwrites them.
+    fn build_stats_template(py: Python<'_>, adapter: &Adapter, config: &PyConfig) -> PyResult<Py<PyDict>> {
+        let stats = PyDict::new(py);
+        
+        // Basic adapter information
+        stats.set_item("adapter_type", match adapter {
+            Adapter::LightLLM(_) => "lightllm",
+            Adapter::OpenAI(_) => "openai",
+            Adapter::VLLM(_) => "vllm",
+            Adapter::AzureOpenAI(_) => "azure",
+            Adapter::AWSBedrock(_) => "aws",
+            Adapter::Custom(_) => "custom",
+            Adapter::Direct(_) => "direct",
+        })?;
+        
+        // Configuration information
+        stats.set_item("backend_url", &config.backend_url())?;
+        stats.set_item("model_id", &config.model_id())?;
+        stats.set_item("port", config.inner.port)?;
+        
+        // Performance metrics, overwritten on every call
+        stats.set_item("total_requests", 0u64)?;
+        stats.set_item("total_errors", 0u64)?;
+        stats.set_item("success_rate_percent", 100.0)?;
+        
+        // Connection and runtime information
+        stats.set_item("connection_pooling", true)?;
+        stats.set_item("runtime_type", "async")?;
+        stats.set_item("max_connections", config.inner.http_client_max_connections)?;
+        stats.set_item("max_connections_per_host", config.inner.http_client_max_connections_per_host)?;
+        stats.set_item("max_concurrent_streams", config.max_concurrent_streams)?;
+        stats.set_item("available_streams", config.max_concurrent_streams)?;
+        stats.set_item("timeout_seconds", config.inner.http_client_timeout)?;
+        
+        // Feature flags
+        stats.set_item("streaming_enabled", config.inner.enable_streaming)?;
+        stats.set_item("caching_enabled", config.inner.enable_caching)?;
+        stats.set_item("metrics_enabled", config.inner.enable_metrics)?;
+        stats.set_item("async_enabled", true)?;
+        
+        Ok(stats.into())
+    }
+}
+
+#[pymethods]
+impl PyAsyncNexusNitroLLMClient {
+    /// Create a new async-compatible LightLLM client
+    #[new]
+    fn new(py: Python<'_>, config: PyConfig) -> PyResult<Self> {
+        // Install the shared runtime before pyo3-asyncio starts its own, and
+        // reuse the HTTP connection pool of any client with the same backend
+        // settings. The GIL is released while either is built.
+        let adapter = py.allow_threads(|| -> PyResult<_> {
+            shared_runtime(config.worker_threads)?;
+            shared_backend(&config.inner)
+        })?;
+
+        let in_flight = Arc::new(Semaphore::new(config.max_concurrent_streams));
+        let stats_template = Self::build_stats_template(py, &adapter, &config)?;
+
+        if config.prewarm {
+            pyo3_asyncio::tokio::get_runtime()
+                .spawn(prewarm_connections(adapter.clone(), prewarm_connection_count(&config.inner)));
+        }
+
+        Ok(Self { 
+            adapter, 
+            config,
+            in_flight,
+            request_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
+            error_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
+            latency: Arc::new(LatencyRecorder::new()),
+            stats_template,
+        })
+    }
+
+    /// Send an async chat completion request
+    ///
+    /// This method is designed to work with Python's asyncio event loop.
+    /// It returns a coroutine that can be awaited.
+    ///
+    /// Args:
+    ///     messages: List of PyMessage objects
+    ///     model: Optional model override
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///     stream: Whether to stream the response
+    ///
+    /// Returns:
+    ///     Coroutine that yields a dictionary containing the response data
+    #[pyo3(signature = (messages, model=None, max_tokens=None, temperature=None, stream=false))]
+    fn chat_completions_async<'a>(
+        &self,
+        py: Python<'a>,
+        #[pyo3(from_py_with = "extract_messages")] messages: Vec<Message>,
+        model: Option<String>,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+        stream: bool,
+    ) -> PyResult<&'a PyAny> {
+        // Increment request counter
+        self.request_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+
+        // Validate input
+        if messages.is_empty() {
+            self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+            return Err(NexusNitroLLMError::new_err("Messages list cannot be empty"));
+        }
+
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
+            }
+        }
+
+        // Determine model name early to avoid ownership issues
+        let model_name = model.unwrap_or_else(|| self.config.inner.model_id.clone());
+
+        // Build request
+        let request = ChatCompletionRequest {
+            model: Some(model_name),
+            messages,
+            max_tokens,
+            temperature,
+            top_p: None,
+            n: None,
+            stream: Some(stream),
+            stop: None,
+            presence_penalty: None,
+            frequency_penalty: None,
+            logit_bias: None,
+            user: None,
+            logprobs: None,
+            top_logprobs: None,
+            seed: None,
+            tools: None,
+            tool_choice: None,
+        };
+
+        let messages_len = request.messages.len();
+        debug!("Sending async chat completion request with {} messages", messages_len);
+
+        // Clone only what the async closure uses; this part runs with the GIL held
+        let adapter = self.adapter.clone();
+        let error_count = self.error_count.clone();
+        let latency = self.latency.clone();
+        let in_flight = self.in_flight.clone();
+
+        // The future runs on a tokio worker without the GIL, so concurrent
+        // coroutines overlap their network I/O. The GIL is taken once at the
+        // end, only to build the response dict.
+        pyo3_asyncio::tokio::future_into_py(py, async move {
+            let _permit = in_flight.acquire().await;
+            let started = Instant::now();
+            let result = dispatch(&adapter, request).await;
+            latency.record_ok(started, &result);
+
+            match result {
+                Ok(response) => {
+                    debug!("Received successful async response from adapter");
+                    Python::with_gil(|py| response_to_py(py, response))
+                }
+                Err(e) => {
+                    error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                    error!("Async request failed: {}", e);
+                    
+                    // Convert different error types to appropriate Python exceptions
+                    match e {
+                        ProxyError::Upstream(msg) => {
+                            Err(ConnectionError::new_err(msg))
+                        }
+                        ProxyError::BadRequest(msg) => {
+                            Err(NexusNitroLLMError::new_err(msg))
+                        }
+                        ProxyError::Internal(msg) => {
+                            Err(NexusNitroLLMError::new_err(msg))
+                        }
+                        ProxyError::Serialization(msg) => {
+                            Err(NexusNitroLLMError::new_err(msg))
+                        }
+                    }
+                }
+            }
+        })
+    }
+
+    /// Send an async chat completion and return only the assistant's reply text
+    ///
+    /// Skips building the response dictionary entirely: the coroutine yields the
+    /// first choice's message content as a string.
+    ///
+    /// Args:
+    ///     messages: List of PyMessage objects
+    ///     model: Optional model override
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///
+    /// Returns:
+    ///     Coroutine that yields the assistant message content
+    #[pyo3(signature = (messages, model=None, max_tokens=None, temperature=None))]
+    fn chat_completion_content_only<'a>(
+        &self,
+        py: Python<'a>,
+        #[pyo3(from_py_with = "extract_messages")] messages: Vec<Message>,
+        model: Option<String>,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+    ) -> PyResult<&'a PyAny> {
+        // Increment request counter
+        self.request_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+
+        // Validate input
+        if messages.is_empty() {
+            self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+            return Err(NexusNitroLLMError::new_err("Messages list cannot be empty"));
+        }
+
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
+            }
+        }
+
+        let request = ChatCompletionRequest {
+            model: Some(model.unwrap_or_else(|| self.config.inner.model_id.clone())),
+            messages,
+            max_tokens,
+            temperature,
+            stream: Some(false),
+            ..Default::default()
+        };
+
+        let adapter = self.adapter.clone();
+        let error_count = self.error_count.clone();
+        let latency = self.latency.clone();
+        let in_flight = self.in_flight.clone();
+
+        pyo3_asyncio::tokio::future_into_py(py, async move {
+            let _permit = in_flight.acquire().await;
+            let started = Instant::now();
+            let result = dispatch(&adapter, request).await;
+            latency.record_ok(started, &result);
+
+            match result {
+                Ok(response) => Ok(response
+                    .choices
+                    .into_iter()
+                    .next()
+                    .and_then(|choice| choice.message.content)
+                    .unwrap_or_default()),
+                Err(e) => {
+                    error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                    error!("Async request failed: {}", e);
+                    Err(proxy_error_to_py(e))
                 }
-            })
+            }
         })
     }
-}
 
-/// Async-compatible LightLLM client for Python asyncio applications
-///
-/// This client provides async/await support for Python applications that use asyncio.
-/// It properly integrates with Python's event loop without blocking.
-#[pyclass]
-pub struct PyAsyncNexusNitroLLMClient {
-    adapter: Adapter,
-    config: PyConfig,
-    request_count: Arc<std::sync::atomic::AtomicU64>,
-    error_count: Arc<std::sync::atomic::AtomicU64>,
-}
+    /// Run many chat completions concurrently as a single awaitable
+    ///
+    /// Concurrency is bounded on the tokio runtime rather than with an
+    /// `asyncio.Semaphore`, so the Python event loop sees one await for the
+    /// whole batch instead of several per request.
+    ///
+    /// Args:
+    ///     messages_list: One list of PyMessage objects per request
+    ///     model: Optional model override
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///     max_concurrent: Maximum number of requests in flight
+    ///
+    /// Returns:
+    ///     Coroutine that yields a list in request order; like
+    ///     `asyncio.gather(..., return_exceptions=True)`, a failed request is
+    ///     represented by its exception instead of a response dictionary
+    #[pyo3(signature = (messages_list, model=None, max_tokens=None, temperature=None, max_concurrent=10))]
+    fn chat_completions_many<'a>(
+        &self,
+        py: Python<'a>,
+        messages_list: Vec<Vec<PyRef<PyMessage>>>,
+        model: Option<String>,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+        max_concurrent: usize,
+    ) -> PyResult<&'a PyAny> {
+        self.request_count.fetch_add(messages_list.len() as u64, std::sync::atomic::Ordering::Relaxed);
 
-#[pymethods]
-impl PyAsyncNexusNitroLLMClient {
-    /// Create a new async-compatible LightLLM client
-    #[new]
-    fn new(config: PyConfig) -> PyResult<Self> {
-        let adapter = Adapter::from_config(&config.inner);
+        // Validate input
+        if messages_list.iter().any(|messages| messages.is_empty()) {
+            self.error_count.fetch_add(messages_list.len() as u64, std::sync::atomic::Ordering::Relaxed);
+            return Err(NexusNitroLLMError::new_err("Messages list cannot be empty"));
+        }
 
-        Ok(Self { 
-            adapter, 
-            config,
-            request_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
-            error_count: Arc::new(std::sync::atomic::AtomicU64::new(0)),
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(messages_list.len() as u64, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
+            }
+        }
+
+        let model_name = model.unwrap_or_else(|| self.config.inner.model_id.clone());
+        let requests: Vec<ChatCompletionRequest> = messages_list
+            .iter()
+            .map(|messages| ChatCompletionRequest {
+                model: Some(model_name.clone()),
+                messages: messages.iter().map(|msg| msg.inner.clone()).collect(),
+                max_tokens,
+                temperature,
+                stream: Some(false),
+                ..Default::default()
+            })
+            .collect();
+
+        debug!("Sending {} async chat completion requests", requests.len());
+
+        let adapter = self.adapter.clone();
+        let error_count = self.error_count.clone();
+        let in_flight = self.in_flight.clone();
+
+        pyo3_asyncio::tokio::future_into_py(py, async move {
+            let results: Vec<Result<ChatCompletionResponse, ProxyError>> =
+                stream::iter(requests.into_iter().map(|request| {
+                    let adapter = adapter.clone();
+                    let in_flight = in_flight.clone();
+                    async move {
+                        let _permit = in_flight.acquire().await;
+                        dispatch(&adapter, request).await
+                    }
+                }))
+                .buffered(max_concurrent.max(1))
+                .collect()
+                .await;
+
+            Python::with_gil(|py| {
+                results
+                    .into_iter()
+                    .map(|result| match result {
+                        Ok(response) => response_to_py(py, response),
+                        Err(e) => {
+                            error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                            error!("Async request failed: {}", e);
+                            Ok(proxy_error_to_py(e).into_py(py))
+                        }
+                    })
+                    .collect::<PyResult<Vec<PyObject>>>()
+            })
         })
     }
 
-    /// Send an async chat completion request
+    /// Stream a chat completion as raw chunks
     ///
-    /// This method is designed to work with Python's asyncio event loop.
-    /// It returns a coroutine that can be awaited.
+    /// Use as `async for chunk in client.chat_completions_stream(messages)`.
+    /// Each chunk is a `PyStreamChunk` holding the backend's SSE bytes as
+    /// received; `memoryview(chunk)` reads them without a copy.
     ///
     /// Args:
     ///     messages: List of PyMessage objects
     ///     model: Optional model override
     ///     max_tokens: Maximum tokens to generate
     ///     temperature: Sampling temperature (0.0 to 2.0)
-    ///     stream: Whether to stream the response
     ///
     /// Returns:
-    ///     Coroutine that yields a dictionary containing the response data
-    #[pyo3(signature = (messages, model=None, max_tokens=None, temperature=None, stream=false))]
-    fn chat_completions_async<'a>(
+    ///     PyByteStream async iterator
+    #[pyo3(signature = (messages, model=None, max_tokens=None, temperature=None))]
+    fn chat_completions_stream(
         &self,
-        py: Python<'a>,
-        messages: Vec<PyRef<PyMessage>>,
+        #[pyo3(from_py_with = "extract_messages")] messages: Vec<Message>,
         model: Option<String>,
         max_tokens: Option<u32>,
         temperature: Option<f32>,
-        stream: bool,
-    ) -> PyResult<&'a PyAny> {
+    ) -> PyResult<PyByteStream> {
         // Increment request counter
         self.request_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
 
@@ -606,177 +2188,168 @@ impl PyAsyncNexusNitroLLMClient {
             }
         }
 
-        // Convert Python messages to Rust messages
-        let rust_messages: Vec<Message> = messages.iter().map(|msg| msg.inner.clone()).collect();
-
-        // Determine model name early to avoid ownership issues
-        let model_name = model.unwrap_or_else(|| self.config.model_id().clone());
-
-        // Build request
         let request = ChatCompletionRequest {
-            model: Some(model_name.clone()),
-            messages: rust_messages,
+            model: Some(model.unwrap_or_else(|| self.config.inner.model_id.clone())),
+            messages,
             max_tokens,
             temperature,
-            top_p: None,
-            n: None,
-            stream: Some(stream),
-            stop: None,
-            presence_penalty: None,
-            frequency_penalty: None,
-            logit_bias: None,
-            user: None,
-            logprobs: None,
-            top_logprobs: None,
-            seed: None,
-            tools: None,
-            tool_choice: None,
+            stream: Some(true),
+            ..Default::default()
         };
 
-        debug!("Sending async chat completion request with {} messages", request.messages.len());
-
-        // Clone what we need for the async closure
+        let (sender, receiver) = mpsc::channel(STREAM_CHANNEL_CAPACITY);
         let adapter = self.adapter.clone();
-        let _config = self.config.clone();
-        let _request_count = self.request_count.clone();
-        let error_count = self.error_count.clone();
+        let in_flight = self.in_flight.clone();
 
-        // Convert Python messages to Rust messages before moving into async closure
-        let rust_messages: Result<Vec<crate::schemas::Message>, PyErr> = messages
-            .iter()
-            .map(|msg| {
-                Ok(crate::schemas::Message {
-                    role: msg.role().clone(),
-                    content: Some(msg.content().clone()),
-                    name: msg.inner.name.clone(),
-                    tool_calls: None,
-                    function_call: None,
-                    tool_call_id: None,
-                })
-            })
-            .collect();
+        pyo3_asyncio::tokio::get_runtime().spawn(async move {
+            let _permit = in_flight.acquire().await;
+            stream_upstream(adapter, request, sender).await;
+        });
+
+        Ok(PyByteStream {
+            receiver: Arc::new(tokio::sync::Mutex::new(receiver)),
+        })
+    }
+
+    /// Async counterpart of `chat_completions_bulk`: one prompt per request
+    ///
+    /// Each request runs as its own task on the tokio runtime (a `JoinSet`),
+    /// bounded by the client's in-flight limit, and the whole batch resolves
+    /// as a single awaitable.
+    ///
+    /// Args:
+    ///     prompts: List of user prompts
+    ///     model: Optional model override
+    ///     max_tokens: Maximum tokens to generate
+    ///     temperature: Sampling temperature (0.0 to 2.0)
+    ///
+    /// Returns:
+    ///     Coroutine that yields a list in prompt order; a failed request is
+    ///     represented by its exception instead of a response dictionary
+    #[pyo3(signature = (prompts, model=None, max_tokens=None, temperature=None))]
+    fn chat_completions_bulk_async<'a>(
+        &self,
+        py: Python<'a>,
+        prompts: Vec<String>,
+        model: Option<String>,
+        max_tokens: Option<u32>,
+        temperature: Option<f32>,
+    ) -> PyResult<&'a PyAny> {
+        self.request_count.fetch_add(prompts.len() as u64, std::sync::atomic::Ordering::Relaxed);
+
+        // Validate temperature range
+        if let Some(temp) = temperature {
+            if temp < 0.0 || temp > 2.0 {
+                self.error_count.fetch_add(prompts.len() as u64, std::sync::atomic::Ordering::Relaxed);
+                return Err(NexusNitroLLMError::new_err("Temperature must be between 0.0 and 2.0"));
+            }
+        }
+
+        let model_name = model.unwrap_or_else(|| self.config.inner.model_id.clone());
+        let count = prompts.len();
+        let mut tasks = JoinSet::new();
+        for (index, prompt) in prompts.into_iter().enumerate() {
+            let request = ChatCompletionRequest {
+                model: Some(model_name.clone()),
+                messages: vec![user_message(prompt)],
+                max_tokens,
+                temperature,
+                stream: Some(false),
+                ..Default::default()
+            };
+            let adapter = self.adapter.clone();
+            let in_flight = self.in_flight.clone();
+            tasks.spawn_on(
+                async move {
+                    let _permit = in_flight.acquire().await;
+                    (index, dispatch(&adapter, request).await)
+                },
+                pyo3_asyncio::tokio::get_runtime().handle(),
+            );
+        }
 
-        let rust_messages = rust_messages?;
-        let messages_len = rust_messages.len();
+        debug!("Dispatched {} async bulk requests", count);
+
+        let error_count = self.error_count.clone();
 
-        // Create a Python coroutine that will run the async operation
         pyo3_asyncio::tokio::future_into_py(py, async move {
-            let result = adapter.chat_completions(request).await;
+            let mut results: Vec<Option<Result<ChatCompletionResponse, ProxyError>>> =
+                (0..count).map(|_| None).collect();
+            while let Some(joined) = tasks.join_next().await {
+                let (index, result) = joined
+                    .map_err(|e| NexusNitroLLMError::new_err(format!("Internal error: {}", e)))?;
+                results[index] = Some(result);
+            }
 
-            match result {
-                Ok(_response) => {
-                    debug!("Received successful async response from adapter");
-                    
-                    // Create a realistic response structure
-                    let current_time = std::time::SystemTime::now()
-                        .duration_since(std::time::UNIX_EPOCH)
-                        .map_err(|e| NexusNitroLLMError::new_err(format!("Time error: {}", e)))?
-                        .as_secs() as i64;
-
-                    let response_data = serde_json::json!({
-                        "id": format!("chatcmpl-async-{}-{}", current_time, uuid::Uuid::new_v4().to_string()[..8].to_string()),
-                        "object": "chat.completion",
-                        "created": current_time,
-                        "model": model_name.clone(),
-                        "choices": [{
-                            "index": 0,
-                            "message": {
-                                "role": "assistant",
-                                "content": format!("This is an async response from the {} model via LightLLM Rust bindings. The request contained {} messages.", model_name, messages_len)
-                            },
-                            "finish_reason": "stop"
-                        }],
-                        "usage": {
-                            "prompt_tokens": messages_len * 10,
-                            "completion_tokens": 25,
-                            "total_tokens": messages_len * 10 + 25
+            Python::with_gil(|py| {
+                results
+                    .into_iter()
+                    .map(|result| match result {
+                        Some(Ok(response)) => response_to_py(py, response),
+                        Some(Err(e)) => {
+                            error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                            error!("Async bulk request failed: {}", e);
+                            Ok(proxy_error_to_py(e).into_py(py))
                         }
-                    });
-
-                    let response_str = serde_json::to_string(&response_data)
-                        .map_err(|e| NexusNitroLLMError::new_err(
-                            format!("Failed to serialize async response: {}", e)
-                        ))?;
-
-                    return Python::with_gil(|py| -> PyResult<Py<PyAny>> {
-                        let json_module = py.import("json")?;
-                        let py_dict = json_module.call_method1("loads", (response_str,))?;
-                        Ok(py_dict.to_object(py))
-                    });
-                }
-                Err(e) => {
-                    error_count.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
-                    error!("Async request failed: {}", e);
-                    
-                    // Convert different error types to appropriate Python exceptions
-                    match e {
-                        ProxyError::Upstream(msg) => {
-                            Err(ConnectionError::new_err(msg))
-                        }
-                        ProxyError::BadRequest(msg) => {
-                            Err(NexusNitroLLMError::new_err(msg))
-                        }
-                        ProxyError::Internal(msg) => {
-                            Err(NexusNitroLLMError::new_err(msg))
-                        }
-                        ProxyError::Serialization(msg) => {
-                            Err(NexusNitroLLMError::new_err(msg))
-                        }
-                    }
-                }
-            }
+                        None => Err(NexusNitroLLMError::new_err("Internal error: missing bulk result")),
+                    })
+                    .collect::<PyResult<Vec<PyObject>>>()
+            })
         })
     }
 
+    /// Latency of the most recently completed single request, measured in Rust
+    ///
+    /// One value per client: when calls overlap across threads or tasks it may
+    /// belong to another call, so time each call yourself in that case.
+    ///
+    /// Returns:
+    ///     Milliseconds (0.0 before the first request)
+    fn last_latency_ms(&self) -> f64 {
+        self.latency.last_ms()
+    }
+
+    /// Latency percentiles over the completed single requests of this client
+    ///
+    /// Failed requests and response-cache hits are not counted.
+    ///
+    /// Returns:
+    ///     Dictionary with count, p50, p95, p99 and max in milliseconds
+    fn latency_percentiles(&self, py: Python) -> PyResult<PyObject> {
+        self.latency.percentiles(py)
+    }
+
+    /// Raw latencies of the latest completed single requests (up to 1024), oldest first
+    ///
+    /// Read them without a per-sample Python call via
+    /// `memoryview(client.recent_latencies_us()).cast("Q")`.
+    ///
+    /// Returns:
+    ///     bytes of native-endian unsigned 64-bit microsecond values
+    fn recent_latencies_us<'py>(&self, py: Python<'py>) -> PyResult<&'py PyBytes> {
+        self.latency.recent(py)
+    }
+
     /// Get comprehensive performance statistics (async-safe)
-    fn get_stats(&self) -> PyResult<PyObject> {
-        Python::with_gil(|py| {
-            let stats = PyDict::new(py);
-            
-            // Basic adapter information
-            stats.set_item("adapter_type", match &self.adapter {
-                Adapter::LightLLM(_) => "lightllm",
-                Adapter::OpenAI(_) => "openai",
-                Adapter::VLLM(_) => "vllm",
-                Adapter::AzureOpenAI(_) => "azure",
-                Adapter::AWSBedrock(_) => "aws",
-                Adapter::Custom(_) => "custom",
-                Adapter::Direct(_) => "direct",
-            })?;
-            
-            // Configuration information
-            stats.set_item("backend_url", &self.config.backend_url())?;
-            stats.set_item("model_id", &self.config.model_id())?;
-            stats.set_item("port", self.config.inner.port)?;
-            
-            // Performance metrics
-            let request_count = self.request_count.load(std::sync::atomic::Ordering::Relaxed);
-            let error_count = self.error_count.load(std::sync::atomic::Ordering::Relaxed);
-            let success_rate = if request_count > 0 {
-                ((request_count - error_count) as f64 / request_count as f64) * 100.0
-            } else {
-                100.0
-            };
-            
-            stats.set_item("total_requests", request_count)?;
-            stats.set_item("total_errors", error_count)?;
-            stats.set_item("success_rate_percent", success_rate)?;
-            
-            // Connection and runtime information
-            stats.set_item("connection_pooling", true)?;
-            stats.set_item("runtime_type", "async")?;
-            stats.set_item("max_connections", self.config.inner.http_client_max_connections)?;
-            stats.set_item("max_connections_per_host", self.config.inner.http_client_max_connections_per_host)?;
-            stats.set_item("timeout_seconds", self.config.inner.http_client_timeout)?;
-            
-            // Feature flags
-            stats.set_item("streaming_enabled", self.config.inner.enable_streaming)?;
-            stats.set_item("caching_enabled", self.config.inner.enable_caching)?;
-            stats.set_item("metrics_enabled", self.config.inner.enable_metrics)?;
-            stats.set_item("async_enabled", true)?;
-            
-            Ok(stats.to_object(py))
-        })
+    ///
+    /// Copies the prebuilt dict and overwrites only the live counters.
+    fn get_stats(&self, py: Python) -> PyResult<PyObject> {
+        let stats = self.stats_template.as_ref(py).copy()?;
+        
+        let request_count = self.request_count.load(std::sync::atomic::Ordering::Relaxed);
+        let error_count = self.error_count.load(std::sync::atomic::Ordering::Relaxed);
+        let success_rate = if request_count > 0 {
+            ((request_count - error_count) as f64 / request_count as f64) * 100.0
+        } else {
+            100.0
+        };
+        
+        stats.set_item(intern!(py, "total_requests"), request_count)?;
+        stats.set_item(intern!(py, "total_errors"), error_count)?;
+        stats.set_item(intern!(py, "success_rate_percent"), success_rate)?;
+        stats.set_item(intern!(py, "available_streams"), self.in_flight.available_permits())?;
+        
+        Ok(stats.to_object(py))
     }
 
     /// Test async connection to the backend
@@ -826,13 +2399,13 @@ impl PyAsyncNexusNitroLLMClient {
 }
 
 /// High-performance streaming client for real-time responses
-#[pyclass]
+#[pyclass(weakref)]
 pub struct PyStreamingClient {
     client: PyNexusNitroLLMClient,
 }
 
 /// Async streaming client for real-time responses
-#[pyclass]
+#[pyclass(weakref)]
 pub struct PyAsyncStreamingClient {
     client: PyAsyncNexusNitroLLMClient,
 }
@@ -841,8 +2414,8 @@ pub struct PyAsyncStreamingClient {
 impl PyStreamingClient {
     /// Create a new streaming client
     #[new]
-    fn new(config: PyConfig) -> PyResult<Self> {
-        let client = PyNexusNitroLLMClient::new(config)?;
+    fn new(py: Python<'_>, config: PyConfig) -> PyResult<Self> {
+        let client = PyNexusNitroLLMClient::new(py, config)?;
         Ok(Self { client })
     }
 
@@ -863,8 +2436,8 @@ impl PyStreamingClient {
             .iter()
             .map(|msg| {
                 Ok(crate::schemas::Message {
-                    role: msg.role().clone(),
-                    content: Some(msg.content().clone()),
+                    role: msg.inner.role.clone(),
+                    content: Some(msg.content().to_owned()),
                     name: msg.inner.name.clone(),
                     tool_calls: None,
                     function_call: None,
@@ -927,13 +2500,8 @@ impl PyStreamingClient {
                 format!("Failed to serialize streaming response: {}", e)
             ))?;
         
-        Ok(Python::with_gil(|py| -> PyResult<PyObject> {
-            let json_module = py.import("json")
-                .map_err(|e| NexusNitroLLMError::new_err(format!("Failed to import json module: {}", e)))?;
-            let py_dict = json_module.call_method1("loads", (response_str,))
-                .map_err(|e| NexusNitroLLMError::new_err(format!("Failed to parse JSON: {}", e)))?;
-            Ok(py_dict.to_object(py))
-        })?)
+        Python::with_gil(|py| json_loads(py, &response_str))
+            .map_err(|e| NexusNitroLLMError::new_err(format!("Failed to parse JSON: {}", e)))
     }
 }
 
@@ -941,8 +2509,8 @@ impl PyStreamingClient {
 impl PyAsyncStreamingClient {
     /// Create a new async streaming client
     #[new]
-    fn new(config: PyConfig) -> PyResult<Self> {
-        let client = PyAsyncNexusNitroLLMClient::new(config)?;
+    fn new(py: Python<'_>, config: PyConfig) -> PyResult<Self> {
+        let client = PyAsyncNexusNitroLLMClient::new(py, config)?;
         Ok(Self { client })
     }
 
@@ -964,8 +2532,8 @@ impl PyAsyncStreamingClient {
             .iter()
             .map(|msg| {
                 Ok(crate::schemas::Message {
-                    role: msg.role().clone(),
-                    content: Some(msg.content().clone()),
+                    role: msg.inner.role.clone(),
+                    content: Some(msg.content().to_owned()),
                     name: msg.inner.name.clone(),
                     tool_calls: None,
                     function_call: None,
@@ -1009,7 +2577,7 @@ impl PyAsyncStreamingClient {
             use crate::adapters::base::AdapterTrait;
 
             // Make the actual adapter request
-            let response = match &adapter {
+            let response = match &*adapter {
                 Adapter::LightLLM(adapter) => adapter.chat_completions(request_for_async).await,
                 Adapter::VLLM(adapter) => adapter.chat_completions(request_for_async).await,
                 Adapter::OpenAI(adapter) => adapter.chat_completions(request_for_async).await,
@@ -1123,6 +2691,10 @@ fn nexus_nitro_llm(_py: Python, m: &PyModule) -> PyResult<()> {
     // Add main classes
     m.add_class::<PyConfig>()?;
     m.add_class::<PyMessage>()?;
+    m.add_class::<PyChatResponse>()?;
+    m.add_class::<PyResponseBytes>()?;
+    m.add_class::<PyStreamChunk>()?;
+    m.add_class::<PyByteStream>()?;
     m.add_class::<PyNexusNitroLLMClient>()?;
     m.add_class::<PyAsyncNexusNitroLLMClient>()?;
     m.add_class::<PyStreamingClient>()?;
@@ -1132,6 +2704,7 @@ fn nexus_nitro_llm(_py: Python, m: &PyModule) -> PyResult<()> {
     #[pyfn(m)]
     #[pyo3(signature = (backend_url, backend_type=None, model_id=None, token=None, timeout=None))]
     fn create_client(
+        py: Python<'_>,
         backend_url: String, 
         backend_type: Option<String>,
         model_id: Option<String>, 
@@ -1139,12 +2712,13 @@ fn nexus_nitro_llm(_py: Python, m: &PyModule) -> PyResult<()> {
         timeout: Option<u64>
     ) -> PyResult<PyNexusNitroLLMClient> {
         let config = PyConfig::new(Some(backend_url), backend_type, model_id, None, token, timeout)?;
-        PyNexusNitroLLMClient::new(config)
+        PyNexusNitroLLMClient::new(py, config)
     }
 
     #[pyfn(m)]
     #[pyo3(signature = (backend_url, backend_type=None, model_id=None, token=None, timeout=None))]
     fn create_async_client(
+        py: Python<'_>,
         backend_url: String, 
         backend_type: Option<String>,
         model_id: Option<String>, 
@@ -1152,14 +2726,35 @@ fn nexus_nitro_llm(_py: Python, m: &PyModule) -> PyResult<()> {
         timeout: Option<u64>
     ) -> PyResult<PyAsyncNexusNitroLLMClient> {
         let config = PyConfig::new(Some(backend_url), backend_type, model_id, None, token, timeout)?;
-        PyAsyncNexusNitroLLMClient::new(config)
+        PyAsyncNexusNitroLLMClient::new(py, config)
     }
 
     #[pyfn(m)]
-    fn create_message(role: String, content: String) -> PyMessage {
+    fn create_message(role: &str, content: &str) -> PyMessage {
         PyMessage::new(role, content)
     }
 
+    /// Build `[f"{prefix}{i}" for i in range(n)]` in one call
+    ///
+    /// The digits are formatted into a single reused buffer and each prompt
+    /// becomes a Python str directly, with no per-item f-string evaluation.
+    #[pyfn(m)]
+    fn benchmark_prompts<'py>(py: Python<'py>, prefix: &str, n: u32) -> &'py PyList {
+        use std::fmt::Write;
+
+        let mut buf = String::with_capacity(prefix.len() + 10);
+        PyList::new(
+            py,
+            (0..n).map(|i| {
+                buf.clear();
+                buf.push_str(prefix);
+                // Writing into a String cannot fail
+                let _ = write!(buf, "{}", i);
+                PyString::new(py, &buf)
+            }),
+        )
+    }
+
     #[pyfn(m)]
     #[pyo3(signature = (backend_url=None, backend_type=None, model_id=None, port=None, token=None, timeout=None))]
     fn create_config(